@@ -1,4 +1,7 @@
 """Flask app entrypoint for Vercel deployment."""
 from backend.app import app
+from backend.database import init_database
+
+init_database()
 
 # Vercel will use the 'app' object
\ No newline at end of file
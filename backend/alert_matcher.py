@@ -0,0 +1,89 @@
+"""Compiled keyword and location matching for job alerts."""
+import re
+
+from config import ALERT_MATCH_WHOLE_WORDS
+
+
+class AlertMatcher:
+    """
+    Matches jobs against alert keywords (in the title) and locations.
+
+    Each rule list is compiled once into a single case-insensitive regex
+    alternation, so checking a job costs one scan per field regardless of
+    how many rules there are. Multi-word rules match as phrases with any
+    whitespace between the words. With whole_words, a rule only matches at
+    word boundaries ("java" does not match "javascript").
+
+    A job passes when it matches at least one keyword and at least one
+    location; an empty rule list places no restriction.
+    """
+
+    def __init__(self, keywords, locations, whole_words=ALERT_MATCH_WHOLE_WORDS):
+        self.keywords = self._compile(keywords, whole_words)
+        self.locations = self._compile(locations, whole_words)
+
+    @staticmethod
+    def _normalize(text):
+        return " ".join(text.lower().split())
+
+    @classmethod
+    def _compile(cls, rules, whole_words):
+        """Compile rules into (regex, [rule per capture group]), or None if there are none."""
+        rules = [rule for rule in rules if rule and rule.strip()]
+        if not rules:
+            return None
+
+        by_text = {}
+        for rule in rules:
+            by_text.setdefault(cls._normalize(rule), rule)
+
+        # Longest first, so a phrase wins over a keyword it starts with. Each
+        # rule gets its own group: case-insensitive matching can match text
+        # whose lower() differs from the rule's ("İstanbul"), so the matched
+        # text cannot be used to look the rule up.
+        texts = sorted(by_text, key=len, reverse=True)
+        pattern = "|".join(
+            "(" + r"\s+".join(re.escape(word) for word in text.split()) + ")"
+            for text in texts
+        )
+        if whole_words:
+            pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+        return re.compile(pattern, re.IGNORECASE), [by_text[text] for text in texts]
+
+    @classmethod
+    def _find(cls, compiled, text):
+        regex, rules = compiled
+        matched = []
+        for m in regex.finditer(text or ""):
+            rule = rules[m.lastindex - 1]
+            if rule not in matched:
+                matched.append(rule)
+        return matched
+
+    def match(self, job):
+        """
+        Return the rules a job matched as {"keywords": [...], "locations": [...]},
+        or None if the job does not pass the alert criteria.
+        """
+        result = {"keywords": [], "locations": []}
+
+        if self.keywords:
+            result["keywords"] = self._find(self.keywords, job.get("job_title"))
+            if not result["keywords"]:
+                return None
+
+        if self.locations:
+            result["locations"] = self._find(self.locations, job.get("location"))
+            if not result["locations"]:
+                return None
+
+        return result
+
+    def filter(self, jobs):
+        """Return (job, matched_rules) pairs for the jobs that pass."""
+        matches = []
+        for job in jobs:
+            matched = self.match(job)
+            if matched is not None:
+                matches.append((job, matched))
+        return matches
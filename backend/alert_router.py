@@ -0,0 +1,114 @@
+"""Routes new jobs to alert subscribers through an inverted index of rule terms."""
+import re
+from collections import defaultdict
+
+from backend.alert_matcher import AlertMatcher
+
+# Longest word prefix looked up in the index; longer rule words are indexed
+# by their first MAX_INDEXED_PREFIX characters.
+MAX_INDEXED_PREFIX = 24
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _words(text):
+    return _WORD_RE.findall((text or "").lower())
+
+
+class AlertRouter:
+    """
+    Finds the subscribers each job should be sent to.
+
+    Every subscription is indexed under the first word of each of its rule
+    terms, using its most selective rule list (keywords, then locations,
+    then platforms). A job is looked up by every prefix of every word in
+    the corresponding field, which yields a small candidate set; only those
+    candidates are checked against their full rules. Subscriptions without
+    any such rules match every job.
+
+    Because candidates come from word prefixes, rule terms match from the
+    start of a word ("dev" finds "developer" but not "webdev").
+    """
+
+    def __init__(self, subscriptions):
+        self.subscriptions = {}
+        self.keyword_index = defaultdict(set)
+        self.location_index = defaultdict(set)
+        self.platform_index = defaultdict(set)
+        self.unindexed = set()
+
+        for subscription in subscriptions:
+            sub_id = subscription["id"]
+            self.subscriptions[sub_id] = (
+                subscription,
+                AlertMatcher(subscription["keywords"], subscription["locations"]),
+                {p.lower() for p in subscription["platforms"]},
+                [e.lower() for e in subscription["experience_levels"] if e],
+            )
+            if subscription["keywords"]:
+                self._index(self.keyword_index, subscription["keywords"], sub_id)
+            elif subscription["locations"]:
+                self._index(self.location_index, subscription["locations"], sub_id)
+            elif subscription["platforms"]:
+                for platform in subscription["platforms"]:
+                    self.platform_index[platform.lower()].add(sub_id)
+            else:
+                self.unindexed.add(sub_id)
+
+    @staticmethod
+    def _index(index, terms, sub_id):
+        for term in terms:
+            words = _words(term)
+            if words:
+                index[words[0][:MAX_INDEXED_PREFIX]].add(sub_id)
+
+    @staticmethod
+    def _lookup(index, text):
+        found = set()
+        if not index:
+            return found
+        for word in _words(text):
+            for end in range(1, min(len(word), MAX_INDEXED_PREFIX) + 1):
+                found |= index.get(word[:end], set())
+        return found
+
+    def candidates(self, job):
+        """Subscription ids whose indexed rules could match the job."""
+        found = set(self.unindexed)
+        found |= self._lookup(self.keyword_index, job.get("job_title"))
+        found |= self._lookup(self.location_index, job.get("location"))
+        found |= self.platform_index.get((job.get("source_platform") or "").lower(), set())
+        return found
+
+    def match(self, job):
+        """Return [(subscription, matched_rules)] for every subscription the job satisfies."""
+        matches = []
+        for sub_id in sorted(self.candidates(job)):
+            subscription, matcher, platforms, experience_levels = self.subscriptions[sub_id]
+            if platforms and (job.get("source_platform") or "").lower() not in platforms:
+                continue
+            if experience_levels:
+                experience = (job.get("experience_level") or "").lower()
+                if not any(level in experience for level in experience_levels):
+                    continue
+            matched = matcher.match(job)
+            if matched is not None:
+                matches.append((subscription, matched))
+        return matches
+
+    def route(self, jobs):
+        """
+        Group jobs by recipient email.
+
+        Returns {email: [(job, matched_rules), ...]} with each job at most
+        once per recipient, in the order the jobs were given.
+        """
+        digests = defaultdict(list)
+        seen = defaultdict(set)
+        for index, job in enumerate(jobs):
+            for subscription, matched in self.match(job):
+                email = subscription["email"]
+                if index not in seen[email]:
+                    seen[email].add(index)
+                    digests[email].append((job, matched))
+        return dict(digests)
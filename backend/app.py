@@ -1,30 +1,93 @@
 """Flask backend for Job Notification Tracker."""
+import json
 import os
 import sys
+import threading
 
 # Ensure project root is in path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
 
-from config import FLASK_DEBUG, FLASK_HOST, FLASK_PORT, PROJECT_ROOT
+from config import (
+    API_CACHE_MAX_ENTRIES,
+    API_MAX_PAGE_SIZE,
+    FLASK_DEBUG,
+    FLASK_HOST,
+    FLASK_PORT,
+    PROJECT_ROOT,
+    STREAM_KEEPALIVE_SECONDS,
+)
 from backend.database import (
+    count_jobs,
     get_all_jobs,
+    get_data_generation,
+    get_job_duplicates,
+    get_job_stats,
+    get_jobs_after,
+    get_jobs_page,
+    get_max_job_id,
     get_new_jobs,
     init_database,
     mark_jobs_as_viewed,
+    wait_for_data_change,
 )
+from backend.response_cache import ResponseCache
 from backend.scheduler import JobScheduler
 
 app = Flask(__name__, static_folder=str(PROJECT_ROOT / "frontend"))
 CORS(app)
 
 frontend_dir = PROJECT_ROOT / "frontend"
-scheduler = JobScheduler()
+_scheduler = None
+_scheduler_lock = threading.Lock()
+response_cache = ResponseCache(API_CACHE_MAX_ENTRIES)
+
+# Jobs read per query when streaming to /api/jobs/stream clients.
+STREAM_BATCH_SIZE = 100
+
+
+def get_scheduler():
+    """
+    The app's JobScheduler, created on first use.
+
+    Importing this module must stay free of side effects: parse pool worker
+    processes re-import the main module, and the database is initialized by
+    main() or the deployment entry point.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = JobScheduler()
+        return _scheduler
 
-# Initialize database on app startup
-init_database()
+
+def cached_json(build):
+    """
+    Serve a JSON response from the response cache, with a strong ETag.
+
+    The cache key is the endpoint, its URL arguments, the normalized query
+    string and the data generation, so a poll with unchanged data costs
+    neither a query nor JSON serialization; a matching If-None-Match gets 304 Not Modified.
+    """
+    args = tuple(sorted((k, v.strip()) for k, v in request.args.items(multi=True) if v.strip()))
+    view_args = tuple(sorted((request.view_args or {}).items()))
+    key = (request.endpoint, view_args, args, get_data_generation())
+
+    entry = response_cache.get(key)
+    if entry is None:
+        entry = response_cache.put(key, app.json.response(build()).get_data())
+    body, etag = entry
+
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    # Browsers must revalidate every poll instead of reusing a stale copy.
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 @app.route("/")
@@ -35,7 +98,18 @@ def index():
 
 @app.route("/api/jobs", methods=["GET"])
 def api_get_jobs():
-    """Get all jobs with optional filters."""
+    """
+    Get jobs with optional filters.
+
+    Query parameters beyond the filters:
+        limit: page size; enables keyset pagination (capped at API_MAX_PAGE_SIZE)
+        cursor: next_cursor from the previous page
+        fields: comma-separated columns to return
+        count_only: if true, return only the number of matching jobs
+        archived: if true, query jobs moved out of the hot window instead
+
+    Without limit or cursor every matching job is returned.
+    """
     filters = {
         "search": request.args.get("search", "").strip(),
         "location": request.args.get("location", "").strip(),
@@ -44,16 +118,97 @@ def api_get_jobs():
         "source_platform": request.args.get("source", "").strip(),
     }
     filters = {k: v for k, v in filters.items() if v}
+    if request.args.get("archived", "").lower() in ("1", "true", "yes"):
+        filters["archived"] = True
+
+    count_only = request.args.get("count_only", "").lower() in ("1", "true", "yes")
+    fields = [f.strip() for f in request.args.get("fields", "").split(",") if f.strip()]
+    limit = request.args.get("limit")
+    cursor = request.args.get("cursor", "").strip()
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError:
+            limit = 0
+        if limit < 1:
+            return jsonify({"error": "limit must be a positive integer"}), 400
+
+    def build():
+        if count_only:
+            return {"count": count_jobs(filters)}
 
-    jobs = get_all_jobs(filters)
-    return jsonify({"jobs": jobs, "count": len(jobs)})
+        if limit is None and not cursor:
+            jobs = get_all_jobs(filters, fields=fields)
+            return {"jobs": jobs, "count": len(jobs)}
+
+        page_size = min(limit or API_MAX_PAGE_SIZE, API_MAX_PAGE_SIZE)
+        jobs, next_cursor = get_jobs_page(filters, limit=page_size, cursor=cursor or None, fields=fields)
+        return {"jobs": jobs, "count": len(jobs), "next_cursor": next_cursor}
+
+    try:
+        return cached_json(build)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
 
 @app.route("/api/jobs/new", methods=["GET"])
 def api_get_new_jobs():
     """Get all new jobs."""
-    jobs = get_new_jobs()
-    return jsonify({"jobs": jobs, "count": len(jobs)})
+    def build():
+        jobs = get_new_jobs()
+        return {"jobs": jobs, "count": len(jobs)}
+
+    return cached_json(build)
+
+
+@app.route("/api/jobs/<int:job_id>/duplicates", methods=["GET"])
+def api_get_job_duplicates(job_id):
+    """Get the postings on other platforms linked to a job as near-duplicates."""
+    def build():
+        duplicates = get_job_duplicates(job_id)
+        return {"job_id": job_id, "duplicates": duplicates, "count": len(duplicates)}
+
+    return cached_json(build)
+
+
+@app.route("/api/jobs/stream", methods=["GET"])
+def api_stream_jobs():
+    """
+    Server-Sent Events feed of newly inserted jobs.
+
+    Each job is sent as a `job` event whose id is the job id. The stream
+    resumes after the Last-Event-ID header (sent by EventSource on
+    reconnect) or the ?last_id= parameter; without either it starts with
+    the next job inserted.
+    """
+    last_id = request.headers.get("Last-Event-ID") or request.args.get("last_id")
+    try:
+        last_id = int(last_id) if last_id else get_max_job_id()
+    except ValueError:
+        return jsonify({"error": "Invalid Last-Event-ID"}), 400
+
+    def events(last_id):
+        yield f"retry: {STREAM_KEEPALIVE_SECONDS * 1000}\n\n"
+        generation = get_data_generation()
+        while True:
+            jobs = get_jobs_after(last_id, limit=STREAM_BATCH_SIZE)
+            for job in jobs:
+                last_id = job["id"]
+                yield f"id: {last_id}\nevent: job\ndata: {json.dumps(job)}\n\n"
+            if len(jobs) == STREAM_BATCH_SIZE:
+                continue
+
+            new_generation = wait_for_data_change(generation, STREAM_KEEPALIVE_SECONDS)
+            if new_generation == generation:
+                # Also re-checks the table, catching writes from other processes.
+                yield ": keepalive\n\n"
+            generation = new_generation
+
+    return Response(
+        events(last_id),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.route("/api/jobs/mark-viewed", methods=["POST"])
@@ -65,33 +220,46 @@ def api_mark_viewed():
 
 @app.route("/api/scrape", methods=["POST"])
 def api_trigger_scrape():
-    """Manually trigger scraping."""
-    try:
-        new_jobs = scheduler.scrape_all_platforms()
-        return jsonify({
-            "message": "Scraping completed",
-            "new_jobs_count": len(new_jobs),
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    """
+    Queue a scrape in the background.
 
+    Returns 202 with the run id. A trigger while a run is in flight joins
+    that run if it scrapes every platform, and otherwise queues a follow-up
+    run for the platforms it lacks.
+    """
+    run, started = get_scheduler().trigger_scrape()
+    response = jsonify({**run.to_dict(), "started": started})
+    response.status_code = 202
+    response.headers["Location"] = f"/api/scrape/{run.id}"
+    return response
 
-@app.route("/api/stats", methods=["GET"])
-def api_get_stats():
-    """Get statistics about jobs."""
-    all_jobs = get_all_jobs()
-    new_jobs = get_new_jobs()
 
-    platform_counts = {}
-    for job in all_jobs:
-        p = job.get("source_platform", "Unknown")
-        platform_counts[p] = platform_counts.get(p, 0) + 1
+@app.route("/api/scrape/<run_id>", methods=["GET"])
+def api_get_scrape_run(run_id):
+    """Get progress, per-platform timings and new-job counts for a scrape run."""
+    run = get_scheduler().get_run(run_id)
+    if run is None:
+        return jsonify({"error": "Unknown run id"}), 404
+    return jsonify(run.to_dict())
+
+
+@app.route("/api/schedule", methods=["GET"])
+def api_get_schedule():
+    """Get each platform's adaptive scrape interval, new-job rate and next run time."""
+    return jsonify(get_scheduler().schedule_status())
+
 
-    return jsonify({
-        "total_jobs": len(all_jobs),
-        "new_jobs": len(new_jobs),
-        "platform_counts": platform_counts,
-    })
+@app.route("/api/ingest/stats", methods=["GET"])
+def api_get_ingest_stats():
+    """Get entries, memory footprint and false-positive rate of the seen-hash set."""
+    return jsonify(get_scheduler().ingest_stats())
+
+
+@app.route("/api/stats", methods=["GET"])
+def api_get_stats():
+    """Get statistics about jobs (optional ?days= limits the per-day counts)."""
+    days = max(1, min(request.args.get("days", 30, type=int), 366))
+    return cached_json(lambda: get_job_stats(days=days))
 
 
 @app.route("/<path:path>")
@@ -102,7 +270,7 @@ def serve_static(path):
 
 def main():
     init_database()
-    scheduler.start()
+    get_scheduler().start()
     app.run(host=FLASK_HOST, port=FLASK_PORT, debug=FLASK_DEBUG)
 
 
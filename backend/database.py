@@ -1,22 +1,89 @@
 """SQLite database layer for Job Notification Tracker."""
+import base64
 import hashlib
+import json
+import queue
+import re
 import sqlite3
+import threading
+import time
 
-from config import DATABASE_PATH
+from config import (
+    ARCHIVE_BATCH_SIZE,
+    DATA_CHANGE_POLL_SECONDS,
+    DATABASE_PATH,
+    DB_BUSY_TIMEOUT_SECONDS,
+    DB_CACHE_SIZE_KB,
+    DB_MMAP_SIZE_BYTES,
+    DB_POOL_SIZE,
+    VACUUM_PAGES_PER_STEP,
+)
 
+# Idle connections kept for reuse; LIFO so the warmest connection is reused.
+_connection_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
 
-def get_db_connection():
-    """Create and return a database connection."""
-    conn = sqlite3.connect(str(DATABASE_PATH))
+# Whether the jobs_fts full-text index exists; None until first checked.
+_fts_available = None
+
+# In-process data generation (see get_data_generation): bumped by this
+# process's writers, and by _poll_data_generation for other processes'.
+_data_generation = 0
+_data_changed = threading.Condition()
+
+# Dedicated connection for PRAGMA data_version, and what the last poll saw.
+_generation_poll = {"conn": None, "data_version": None, "generation": None, "checked_at": None}
+_generation_poll_lock = threading.Lock()
+
+
+def _connect():
+    """Open a new connection configured for concurrent readers and writers."""
+    conn = sqlite3.connect(
+        str(DATABASE_PATH),
+        timeout=DB_BUSY_TIMEOUT_SECONDS,
+        check_same_thread=False,
+    )
     conn.row_factory = sqlite3.Row
+    # WAL lets API reads run while the scheduler writes.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA mmap_size={int(DB_MMAP_SIZE_BYTES)}")
+    conn.execute(f"PRAGMA cache_size={-int(DB_CACHE_SIZE_KB)}")
+    conn.execute(f"PRAGMA busy_timeout={int(DB_BUSY_TIMEOUT_SECONDS * 1000)}")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+def get_db_connection():
+    """Check out a pooled database connection. Hand it back with release_db_connection."""
+    try:
+        return _connection_pool.get_nowait()
+    except queue.Empty:
+        return _connect()
+
+
+def release_db_connection(conn):
+    """Return a connection to the pool, discarding any uncommitted work."""
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _connection_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
 def init_database():
     """Initialize the database with required tables."""
     conn = get_db_connection()
     cursor = conn.cursor()
 
+    # auto_vacuum only takes effect through a VACUUM, which is free while
+    # the database is empty; older databases need a one-time
+    # `manage.py archive-jobs --vacuum`.
+    cursor.execute("SELECT COUNT(*) FROM sqlite_master")
+    if cursor.fetchone()[0] == 0:
+        cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        cursor.execute("VACUUM")
+
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS jobs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,14 +123,436 @@ def init_database():
         )
     """)
 
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS email_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email_to TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            body TEXT NOT NULL,
+            job_ids TEXT NOT NULL DEFAULT '[]',
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL DEFAULT 0,
+            last_error TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            sent_at TIMESTAMP
+        )
+    """)
+
+    # Rule columns hold JSON lists; an empty list places no restriction.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS subscriptions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL,
+            keywords TEXT NOT NULL DEFAULT '[]',
+            locations TEXT NOT NULL DEFAULT '[]',
+            platforms TEXT NOT NULL DEFAULT '[]',
+            experience_levels TEXT NOT NULL DEFAULT '[]',
+            active INTEGER NOT NULL DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS http_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            content_hash TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Cold tier: jobs older than JOB_HOT_RETENTION_DAYS, moved here by
+    # archive_old_jobs so the hot jobs table and its indexes stay small.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS jobs_archive (
+            id INTEGER PRIMARY KEY,
+            job_title TEXT NOT NULL,
+            company_name TEXT NOT NULL,
+            location TEXT,
+            experience_level TEXT,
+            job_type TEXT,
+            posted_date TEXT,
+            job_url TEXT NOT NULL,
+            source_platform TEXT NOT NULL,
+            job_hash TEXT NOT NULL UNIQUE,
+            is_new INTEGER DEFAULT 0,
+            created_at TIMESTAMP,
+            updated_at TIMESTAMP,
+            archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # SimHash fingerprints behind backend.dedupe; simhash is stored signed.
+    # They are derived from jobs, so a table from before source_platform was
+    # part of them is dropped and refilled by NearDuplicateIndex.load().
+    cursor.execute("PRAGMA table_info(job_fingerprints)")
+    fingerprint_columns = {row["name"] for row in cursor.fetchall()}
+    if fingerprint_columns and "source_platform" not in fingerprint_columns:
+        cursor.execute("DROP TABLE job_fingerprints")
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS job_fingerprints (
+            job_id INTEGER PRIMARY KEY,
+            simhash INTEGER NOT NULL,
+            company_key TEXT NOT NULL,
+            title_key TEXT NOT NULL,
+            location_key TEXT NOT NULL,
+            source_platform TEXT NOT NULL,
+            FOREIGN KEY (job_id) REFERENCES jobs(id)
+        )
+    """)
+
+    # Postings that were near-duplicates of a stored job, linked to it
+    # instead of being inserted into jobs.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS job_duplicates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            canonical_job_id INTEGER NOT NULL,
+            job_title TEXT NOT NULL,
+            company_name TEXT NOT NULL,
+            location TEXT,
+            job_url TEXT NOT NULL,
+            source_platform TEXT NOT NULL,
+            job_hash TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (canonical_job_id) REFERENCES jobs(id)
+        )
+    """)
+
+    # Adaptive scrape interval state per platform (backend.source_schedule).
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS source_schedule (
+            platform_name TEXT PRIMARY KEY,
+            interval_seconds REAL NOT NULL,
+            yield_rate REAL,
+            last_run_at REAL,
+            next_run_at REAL
+        )
+    """)
+
+    # Newest job hash on the first result page of each search's last run.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_watermarks (
+            platform_name TEXT NOT NULL,
+            query_key TEXT NOT NULL,
+            job_hash TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (platform_name, query_key)
+        )
+    """)
+
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_url ON jobs(job_url)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_job_hash ON jobs(job_hash)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_source_platform ON jobs(source_platform)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_is_new ON jobs(is_new)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_posted_date ON jobs(posted_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_created_at_id ON jobs(created_at, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_outbox_due ON email_outbox(status, next_attempt_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_duplicates_canonical ON job_duplicates(canonical_job_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_archive_created_at_id ON jobs_archive(created_at, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_email_log_sent_at ON email_notifications_log(sent_at)")
+
+    _init_search_index(cursor)
+    _init_job_stats(cursor)
+    _init_data_generation(cursor)
+    _migrate_data(cursor)
 
     conn.commit()
-    conn.close()
+    release_db_connection(conn)
+
+
+def _migrate_data(cursor):
+    """Apply one-time data migrations that PRAGMA user_version says are pending."""
+    cursor.execute("PRAGMA user_version")
+    version = cursor.fetchone()[0]
+
+    if version < 1:
+        # Stored hashes predate URL canonicalization; without this, the next
+        # scrape would store and alert on every listed job again. Imported
+        # here because the scrapers package imports this module.
+        from backend.scrapers.url_canonicalizer import canonicalize_job_url
+
+        updated, merged = _canonicalize_job_urls(cursor, canonicalize_job_url)
+        if updated or merged:
+            print(f"  Canonicalized job URLs: {updated} job(s) rewritten, {merged} duplicate(s) merged")
+        cursor.execute("PRAGMA user_version = 1")
+
+
+def _init_job_stats(cursor):
+    """Create the job_stats counters and the triggers that keep them current."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_stats'")
+    exists = cursor.fetchone() is not None
+
+    # metric is 'total', 'new', 'platform' or 'day'; key is the platform name
+    # or the date for the last two and '' otherwise.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS job_stats (
+            metric TEXT NOT NULL,
+            key TEXT NOT NULL DEFAULT '',
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (metric, key)
+        )
+    """)
+
+    def bump(metric, key, delta):
+        return (
+            f"INSERT INTO job_stats (metric, key, count) VALUES ('{metric}', {key}, {delta}) "
+            f"ON CONFLICT (metric, key) DO UPDATE SET count = count + excluded.count;"
+        )
+
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS job_stats_ai AFTER INSERT ON jobs BEGIN
+            {bump('total', "''", 1)}
+            {bump('new', "''", "(new.is_new = 1)")}
+            {bump('platform', 'new.source_platform', 1)}
+            {bump('day', 'date(new.created_at)', 1)}
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS job_stats_ad AFTER DELETE ON jobs BEGIN
+            {bump('total', "''", -1)}
+            {bump('new', "''", "-(old.is_new = 1)")}
+            {bump('platform', 'old.source_platform', -1)}
+            {bump('day', 'date(old.created_at)', -1)}
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS job_stats_au_new AFTER UPDATE OF is_new ON jobs
+        WHEN (old.is_new = 1) != (new.is_new = 1) BEGIN
+            {bump('new', "''", "(new.is_new = 1) - (old.is_new = 1)")}
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS job_stats_au_platform AFTER UPDATE OF source_platform ON jobs
+        WHEN old.source_platform != new.source_platform BEGIN
+            {bump('platform', 'old.source_platform', -1)}
+            {bump('platform', 'new.source_platform', 1)}
+        END
+    """)
+
+    if not exists:
+        _rebuild_job_stats(cursor)
+
+
+# Tables behind the read API; any write to them bumps data_generation.
+DATA_GENERATION_TABLES = ("jobs", "jobs_archive", "job_duplicates")
+
+_BUMP_DATA_GENERATION = "UPDATE data_generation SET generation = generation + 1 WHERE id = 1;"
+
+
+def _init_data_generation(cursor):
+    """
+    Create the data_generation counter and the triggers that bump it.
+
+    The counter lives in the database rather than in memory so that writes
+    from any process (manage.py commands, a second server) change it too.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS data_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation INTEGER NOT NULL
+        )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO data_generation (id, generation) VALUES (1, 0)")
+    for table in DATA_GENERATION_TABLES:
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_generation_{event.lower()} AFTER {event} ON {table} BEGIN
+                    {_BUMP_DATA_GENERATION}
+                END
+            """)
+
+
+def _rebuild_job_stats(cursor):
+    """Recompute every job_stats counter from the jobs table."""
+    cursor.execute("DELETE FROM job_stats")
+    cursor.execute("INSERT INTO job_stats (metric, key, count) SELECT 'total', '', COUNT(*) FROM jobs")
+    cursor.execute("INSERT INTO job_stats (metric, key, count) SELECT 'new', '', COUNT(*) FROM jobs WHERE is_new = 1")
+    cursor.execute("""
+        INSERT INTO job_stats (metric, key, count)
+        SELECT 'platform', source_platform, COUNT(*) FROM jobs GROUP BY source_platform
+    """)
+    cursor.execute("""
+        INSERT INTO job_stats (metric, key, count)
+        SELECT 'day', date(created_at), COUNT(*) FROM jobs GROUP BY date(created_at)
+    """)
+
+
+def rebuild_job_stats():
+    """Repair the job_stats counters by recomputing them from the jobs table."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    _rebuild_job_stats(cursor)
+    cursor.execute(_BUMP_DATA_GENERATION)
+    conn.commit()
+    release_db_connection(conn)
+    notify_data_change()
+
+
+def get_job_stats(days=30):
+    """
+    Get job totals, new count, per-platform and per-day counts.
+
+    Reads the trigger-maintained job_stats counters, so the cost does not
+    depend on the size of the jobs table. Per-day counts cover the last
+    `days` days that have jobs.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT metric, key, count FROM job_stats WHERE metric != 'day' AND count != 0")
+    rows = cursor.fetchall()
+    cursor.execute(
+        "SELECT key, count FROM job_stats WHERE metric = 'day' AND count != 0 ORDER BY key DESC LIMIT ?",
+        (days,),
+    )
+    daily_counts = {row["key"]: row["count"] for row in cursor.fetchall()}
+    release_db_connection(conn)
+
+    stats = {"total_jobs": 0, "new_jobs": 0, "platform_counts": {}, "daily_counts": daily_counts}
+    for row in rows:
+        if row["metric"] == "total":
+            stats["total_jobs"] = row["count"]
+        elif row["metric"] == "new":
+            stats["new_jobs"] = row["count"]
+        elif row["metric"] == "platform":
+            stats["platform_counts"][row["key"]] = row["count"]
+    return stats
+
+
+def _init_search_index(cursor):
+    """Create the FTS5 index over jobs and backfill it for existing databases."""
+    global _fts_available
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+    exists = cursor.fetchone() is not None
+
+    if not exists:
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE jobs_fts USING fts5(
+                    job_title, company_name, location,
+                    content='jobs', content_rowid='id', prefix='2 3'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            print(f"  Full-text search unavailable ({e}); falling back to LIKE search")
+            _fts_available = False
+            return
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, job_title, company_name, location)
+            VALUES (new.id, new.job_title, new.company_name, new.location);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company_name, location)
+            VALUES ('delete', old.id, old.job_title, old.company_name, old.location);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF job_title, company_name, location ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company_name, location)
+            VALUES ('delete', old.id, old.job_title, old.company_name, old.location);
+            INSERT INTO jobs_fts (rowid, job_title, company_name, location)
+            VALUES (new.id, new.job_title, new.company_name, new.location);
+        END
+    """)
+
+    if not exists:
+        # One-time backfill of jobs stored before the index existed.
+        cursor.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+    _fts_available = True
+
+
+def _search_index_available(cursor):
+    """Return True if the jobs_fts index exists (checked once per process)."""
+    global _fts_available
+    if _fts_available is None:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+        _fts_available = cursor.fetchone() is not None
+    return _fts_available
+
+
+def _fts_terms(text):
+    """Turn free text into an FTS5 expression matching every word as a prefix."""
+    words = re.findall(r"\w+", text.lower())
+    return " AND ".join(f'"{word}"*' for word in words)
+
+
+def get_data_generation():
+    """
+    Return a counter that changes whenever the data behind the read API changes.
+
+    Writers in this process bump it directly (notify_data_change). Writes
+    by other processes are picked up by a poll at most every
+    DATA_CHANGE_POLL_SECONDS, so most calls do no database work.
+    """
+    _poll_data_generation()
+    return _data_generation
+
+
+def _poll_data_generation():
+    """
+    Bump the generation if another process changed the read API's data.
+
+    PRAGMA data_version on a connection that never writes changes whenever
+    any other connection commits; only then is the trigger-maintained
+    data_generation row read, so unrelated writes cost one pragma.
+    """
+    now = time.monotonic()
+    checked_at = _generation_poll["checked_at"]
+    if checked_at is not None and now - checked_at < DATA_CHANGE_POLL_SECONDS:
+        return
+    if not _generation_poll_lock.acquire(blocking=False):
+        return  # Another thread is polling.
+    try:
+        poll = _generation_poll
+        poll["checked_at"] = now
+        if poll["conn"] is None:
+            poll["conn"] = _connect()
+        data_version = poll["conn"].execute("PRAGMA data_version").fetchone()[0]
+        if data_version == poll["data_version"]:
+            return
+        poll["data_version"] = data_version
+        row = poll["conn"].execute("SELECT generation FROM data_generation WHERE id = 1").fetchone()
+        generation = row[0] if row else 0
+        changed = poll["generation"] is not None and generation != poll["generation"]
+        poll["generation"] = generation
+    except sqlite3.Error as e:
+        print(f"  Checking for external data changes failed: {e}")
+        return
+    finally:
+        _generation_poll_lock.release()
+    if changed:
+        notify_data_change()
+
+
+def notify_data_change():
+    """Bump the data generation after committing a change to the read API's data, waking waiters."""
+    global _data_generation
+    with _data_changed:
+        _data_generation += 1
+        _data_changed.notify_all()
+
+
+def wait_for_data_change(generation, timeout):
+    """
+    Block until the data generation differs from `generation` or the timeout passes.
+
+    Changes committed in this process wake waiters at once; changes from
+    other processes are noticed within DATA_CHANGE_POLL_SECONDS.
+    Returns the current generation.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        _poll_data_generation()
+        remaining = deadline - time.monotonic()
+        with _data_changed:
+            if _data_generation != generation or remaining <= 0:
+                return _data_generation
+            _data_changed.wait_for(lambda: _data_generation != generation, min(remaining, DATA_CHANGE_POLL_SECONDS))
 
 
 def generate_job_hash(job_url, job_title, company_name):
@@ -74,55 +563,317 @@ def generate_job_hash(job_url, job_title, company_name):
 
 def insert_job(job_data):
     """Insert a new job. Returns job_id if new, None if duplicate."""
+    return insert_jobs([job_data])[0]
+
+
+def insert_jobs(jobs):
+    """
+    Insert a batch of jobs in a single transaction.
+
+    Duplicates (by job_hash, including repeats within the batch and jobs
+    already archived) are skipped. Returns a list with the new job_id for each job,
+    or None where the job was a duplicate.
+    """
+    if not jobs:
+        return []
+
+    hashes = [
+        generate_job_hash(job_data["job_url"], job_data["job_title"], job_data["company_name"])
+        for job_data in jobs
+    ]
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    job_ids = []
+
+    try:
+        # Look up known hashes first: an ignored INSERT still consumes an
+        # AUTOINCREMENT id, and most scraped jobs are already stored.
+        known = set()
+        unique_hashes = list(set(hashes))
+        for i in range(0, len(unique_hashes), 500):
+            chunk = unique_hashes[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT job_hash FROM jobs WHERE job_hash IN ({marks}) "
+                f"UNION ALL SELECT job_hash FROM jobs_archive WHERE job_hash IN ({marks})",
+                chunk + chunk,
+            )
+            known.update(row["job_hash"] for row in cursor.fetchall())
+
+        for job_data, job_hash in zip(jobs, hashes):
+            if job_hash in known:
+                job_ids.append(None)
+                continue
+            known.add(job_hash)
+            cursor.execute("""
+                INSERT OR IGNORE INTO jobs (
+                    job_title, company_name, location, experience_level,
+                    job_type, posted_date, job_url, source_platform, job_hash, is_new
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+            """, (
+                job_data["job_title"],
+                job_data["company_name"],
+                job_data.get("location", ""),
+                job_data.get("experience_level", ""),
+                job_data.get("job_type", ""),
+                job_data.get("posted_date", ""),
+                job_data["job_url"],
+                job_data["source_platform"],
+                job_hash,
+            ))
+            job_ids.append(cursor.lastrowid if cursor.rowcount == 1 else None)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        release_db_connection(conn)
+
+    if any(job_ids):
+        notify_data_change()
+    return job_ids
+
+
+def get_known_job_hashes(batch_size=10000):
+    """Yield every job_hash stored in jobs, jobs_archive or linked in job_duplicates."""
+    conn = get_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT job_hash FROM jobs UNION ALL SELECT job_hash FROM jobs_archive "
+            "UNION ALL SELECT job_hash FROM job_duplicates"
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield row[0]
+    finally:
+        release_db_connection(conn)
+
+
+def get_job_fingerprints():
+    """Get all stored job fingerprints."""
     conn = get_db_connection()
     cursor = conn.cursor()
+    cursor.execute("SELECT * FROM job_fingerprints")
+    rows = [dict(row) for row in cursor.fetchall()]
+    release_db_connection(conn)
+    return rows
+
+
+def get_jobs_without_fingerprints(after_id=0, limit=1000):
+    """
+    Get stored jobs with an id above after_id that have no fingerprint yet, oldest first.
 
-    job_hash = generate_job_hash(
-        job_data["job_url"],
-        job_data["job_title"],
-        job_data["company_name"],
+    Pass the last id returned to get the next batch; each batch is an index
+    range scan, so a full backfill stays linear in the number of jobs.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT id, job_title, company_name, location, source_platform FROM jobs "
+        "WHERE id > ? AND NOT EXISTS (SELECT 1 FROM job_fingerprints WHERE job_id = jobs.id) ORDER BY id LIMIT ?",
+        (after_id, limit),
     )
+    jobs = [dict(row) for row in cursor.fetchall()]
+    release_db_connection(conn)
+    return jobs
 
-    cursor.execute("SELECT id FROM jobs WHERE job_hash = ?", (job_hash,))
-    if cursor.fetchone():
-        conn.close()
-        return None
-
-    cursor.execute("""
-        INSERT INTO jobs (
-            job_title, company_name, location, experience_level,
-            job_type, posted_date, job_url, source_platform, job_hash, is_new
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-    """, (
-        job_data["job_title"],
-        job_data["company_name"],
-        job_data.get("location", ""),
-        job_data.get("experience_level", ""),
-        job_data.get("job_type", ""),
-        job_data.get("posted_date", ""),
-        job_data["job_url"],
-        job_data["source_platform"],
-        job_hash,
-    ))
-
-    job_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    return job_id
+
+def save_job_fingerprints(rows):
+    """Store (job_id, fingerprint) pairs in a single transaction."""
+    if not rows:
+        return
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT OR REPLACE INTO job_fingerprints "
+        "(job_id, simhash, company_key, title_key, location_key, source_platform) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            # SQLite integers are signed 64-bit.
+            (job_id, fp.simhash - (1 << 64) if fp.simhash >= 1 << 63 else fp.simhash,
+             fp.company_key, fp.title_key, fp.location_key, fp.platform)
+            for job_id, fp in rows
+        ],
+    )
+    conn.commit()
+    release_db_connection(conn)
+
+
+def link_duplicate_jobs(links):
+    """
+    Record (job, canonical_job_id) pairs in job_duplicates.
+
+    Postings already stored as a job or already linked are skipped, so a
+    re-scrape of the canonical posting itself is not recorded.
+    """
+    if not links:
+        return
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    rows = []
+    for job_data, canonical_job_id in links:
+        job_hash = generate_job_hash(job_data["job_url"], job_data["job_title"], job_data["company_name"])
+        rows.append((
+            canonical_job_id, job_data["job_title"], job_data["company_name"],
+            job_data.get("location", ""), job_data["job_url"], job_data["source_platform"],
+            job_hash, job_hash,
+        ))
+    cursor.executemany("""
+        INSERT OR IGNORE INTO job_duplicates (
+            canonical_job_id, job_title, company_name, location, job_url, source_platform, job_hash
+        )
+        SELECT ?, ?, ?, ?, ?, ?, ?
+        WHERE NOT EXISTS (SELECT 1 FROM jobs WHERE job_hash = ?)
+    """, rows)
+    linked = cursor.rowcount
+    conn.commit()
+    release_db_connection(conn)
+    if linked > 0:
+        notify_data_change()
 
 
-def get_all_jobs(filters=None):
-    """Get all jobs with optional filters."""
+def get_job_duplicates(job_id):
+    """Get the postings linked to a canonical job as near-duplicates."""
     conn = get_db_connection()
     cursor = conn.cursor()
+    cursor.execute("SELECT * FROM job_duplicates WHERE canonical_job_id = ? ORDER BY id", (job_id,))
+    duplicates = [dict(row) for row in cursor.fetchall()]
+    release_db_connection(conn)
+    return duplicates
 
-    query = "SELECT * FROM jobs WHERE 1=1"
+
+def canonicalize_job_urls(canonicalize):
+    """
+    Rewrite stored job URLs with canonicalize(platform, url) and recompute their hashes.
+
+    Jobs whose canonical URL makes them the same posting are merged into the
+    oldest one: notification log entries and near-duplicate links move to it,
+    it stays new if any merged copy was new, and the other rows are deleted.
+    Archived jobs are rewritten the same way; an archived copy of a job that
+    is still in the hot table is merged into the hot job. Runs in a single
+    transaction. Returns (updated, merged) row counts.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        updated, merged = _canonicalize_job_urls(cursor, canonicalize)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        release_db_connection(conn)
+
+    if updated or merged:
+        notify_data_change()
+    return updated, merged
+
+
+def _canonicalize_job_urls(cursor, canonicalize):
+    """canonicalize_job_urls within the caller's transaction."""
+    hot_hashes = {}
+    updated, merged = 0, 0
+    for table in ("jobs", "jobs_archive"):
+        cursor.execute(
+            f"SELECT id, job_title, company_name, job_url, job_hash, source_platform, is_new FROM {table} ORDER BY id"
+        )
+        groups = {}
+        for row in cursor.fetchall():
+            url = canonicalize(row["source_platform"], row["job_url"])
+            job_hash = generate_job_hash(url, row["job_title"], row["company_name"])
+            groups.setdefault(job_hash, []).append((row, url))
+
+        updates = []
+        for job_hash, members in groups.items():
+            # An archived posting that is also in jobs folds into the hot row.
+            keeper_id = hot_hashes.get(job_hash)
+            if keeper_id is None:
+                keeper, url = members[0]
+                keeper_id = keeper["id"]
+                is_new = max(row["is_new"] for row, _ in members)
+                if url != keeper["job_url"] or job_hash != keeper["job_hash"] or is_new != keeper["is_new"]:
+                    updates.append((url, job_hash, is_new, keeper_id))
+                duplicates = [row["id"] for row, _ in members[1:]]
+            else:
+                duplicates = [row["id"] for row, _ in members]
+            if table == "jobs":
+                hot_hashes[job_hash] = keeper_id
+
+            if duplicates:
+                marks = ",".join("?" * len(duplicates))
+                cursor.execute(
+                    f"UPDATE email_notifications_log SET job_id = ? WHERE job_id IN ({marks})", [keeper_id] + duplicates,
+                )
+                cursor.execute(
+                    f"UPDATE job_duplicates SET canonical_job_id = ? WHERE canonical_job_id IN ({marks})",
+                    [keeper_id] + duplicates,
+                )
+                cursor.execute(f"DELETE FROM job_fingerprints WHERE job_id IN ({marks})", duplicates)
+                cursor.execute(f"DELETE FROM {table} WHERE id IN ({marks})", duplicates)
+                merged += len(duplicates)
+
+        # Deletes come first so no rewritten hash collides with a merged row.
+        cursor.executemany(
+            f"UPDATE {table} SET job_url = ?, job_hash = ?, is_new = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+            updates,
+        )
+        updated += len(updates)
+
+    # Linked near-duplicates get the same treatment; a link that is now
+    # the same posting as a stored job or an earlier link is dropped.
+    cursor.execute("SELECT job_hash FROM jobs UNION ALL SELECT job_hash FROM jobs_archive")
+    seen = {row["job_hash"] for row in cursor.fetchall()}
+    cursor.execute("SELECT id, job_title, company_name, job_url, job_hash, source_platform FROM job_duplicates ORDER BY id")
+    dropped, relinked = [], []
+    for row in cursor.fetchall():
+        url = canonicalize(row["source_platform"], row["job_url"])
+        job_hash = generate_job_hash(url, row["job_title"], row["company_name"])
+        if job_hash in seen:
+            dropped.append((row["id"],))
+            continue
+        seen.add(job_hash)
+        if job_hash != row["job_hash"]:
+            relinked.append((url, job_hash, row["id"]))
+    cursor.executemany("DELETE FROM job_duplicates WHERE id = ?", dropped)
+    cursor.executemany("UPDATE job_duplicates SET job_url = ?, job_hash = ? WHERE id = ?", relinked)
+    return updated, merged
+
+
+# Columns a client may request through a field projection.
+JOB_FIELDS = (
+    "id", "job_title", "company_name", "location", "experience_level", "job_type",
+    "posted_date", "job_url", "source_platform", "job_hash", "is_new",
+    "created_at", "updated_at",
+)
+
+
+def _job_filter_clause(filters, cursor):
+    """
+    Build the WHERE clause and parameters for job filters.
+
+    Search and location filters go through the jobs_fts index when it is
+    available (word-prefix matching); otherwise, and always for archived
+    jobs, they fall back to LIKE. Returns (where, params, fts_query);
+    fts_query is the MATCH expression, or None when the full-text index is
+    not used.
+    """
+    query = " WHERE 1=1"
     params = []
+    fts_parts = []
+    use_fts = not _archived(filters) and _search_index_available(cursor)
 
     if filters:
         if filters.get("location"):
-            query += " AND location LIKE ?"
-            params.append(f"%{filters['location']}%")
+            terms = _fts_terms(filters["location"]) if use_fts else ""
+            if terms:
+                fts_parts.append(f"location : ({terms})")
+            else:
+                query += " AND jobs.location LIKE ?"
+                params.append(f"%{filters['location']}%")
 
         if filters.get("experience_level"):
             query += " AND experience_level LIKE ?"
@@ -137,25 +888,195 @@ def get_all_jobs(filters=None):
             params.append(filters["source_platform"])
 
         if filters.get("search"):
-            query += " AND (job_title LIKE ? OR company_name LIKE ?)"
-            search_term = f"%{filters['search']}%"
-            params.extend([search_term, search_term])
+            terms = _fts_terms(filters["search"]) if use_fts else ""
+            if terms:
+                fts_parts.append(f"{{job_title company_name}} : ({terms})")
+            else:
+                query += " AND (jobs.job_title LIKE ? OR jobs.company_name LIKE ?)"
+                search_term = f"%{filters['search']}%"
+                params.extend([search_term, search_term])
+
+    fts_query = " AND ".join(fts_parts) or None
+    return query, params, fts_query
+
+
+def _archived(filters):
+    """Whether filters ask for the archive instead of the hot jobs table."""
+    return bool(filters and filters.get("archived"))
+
+
+def _jobs_source(fts_query, archived=False):
+    """
+    FROM clause for job queries, joined to full-text matches when searching.
 
-    query += " ORDER BY created_at DESC, posted_date DESC"
+    Archived queries read jobs_archive under the alias jobs, so the same
+    column references work for both tiers.
+    """
+    if archived:
+        return " FROM jobs_archive AS jobs", []
+    if not fts_query:
+        return " FROM jobs", []
+    return " FROM jobs JOIN (SELECT rowid AS match_id, rank FROM jobs_fts WHERE jobs_fts MATCH ?) AS matches ON matches.match_id = jobs.id", [fts_query]
 
-    cursor.execute(query, params)
+
+def _select_columns(fields, required=()):
+    """Validate a field projection. Returns the SELECT column list."""
+    if not fields:
+        return "jobs.*"
+    unknown = [f for f in fields if f not in JOB_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    columns = list(dict.fromkeys(list(required) + list(fields)))
+    return ", ".join(f"jobs.{column}" for column in columns)
+
+
+def get_all_jobs(filters=None, fields=None):
+    """
+    Get all jobs with optional filters and field projection.
+
+    Full-text searches are ordered by relevance, everything else newest first.
+    """
+    # Validate before checking out a connection, so errors cannot leak it.
+    columns = _select_columns(fields)
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    where, params, fts_query = _job_filter_clause(filters, cursor)
+    source, source_params = _jobs_source(fts_query, _archived(filters))
+    order = "matches.rank, " if fts_query else ""
+    query = (
+        f"SELECT {columns}{source}{where} "
+        f"ORDER BY {order}jobs.created_at DESC, jobs.posted_date DESC"
+    )
+
+    cursor.execute(query, source_params + params)
     jobs = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    release_db_connection(conn)
     return jobs
 
 
+def encode_job_cursor(sort_key, job_id):
+    """
+    Encode a keyset position as an opaque cursor string.
+
+    sort_key is created_at for newest-first pages and the bm25 rank for
+    full-text searches.
+    """
+    raw = json.dumps([sort_key, job_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_job_cursor(cursor):
+    """Decode a cursor from encode_job_cursor. Raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_key, job_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if isinstance(sort_key, bool) or not isinstance(sort_key, (str, int, float)):
+        raise ValueError("Invalid cursor")
+    if isinstance(job_id, bool) or not isinstance(job_id, int):
+        raise ValueError("Invalid cursor")
+    return sort_key, job_id
+
+
+def get_jobs_page(filters=None, limit=50, cursor=None, fields=None):
+    """
+    Get one page of jobs using keyset pagination.
+
+    Pages are ordered by (created_at, id) descending, newest first, so each
+    page costs an index seek rather than an OFFSET scan. Full-text searches
+    are ordered by relevance instead, (rank, id) ascending as in
+    get_all_jobs; bm25 ranks are computed per query, so each page ranks the
+    matches again but still skips no rows by OFFSET. id and created_at are
+    always returned; the rank is only used for the cursor.
+
+    Returns (jobs, next_cursor); next_cursor is None on the last page.
+    Raises ValueError for an unknown field or a malformed cursor, including
+    a cursor from a page with the other ordering.
+    """
+    # Validate before checking out a connection, so errors cannot leak it.
+    columns = _select_columns(fields, required=("id", "created_at"))
+    position = decode_job_cursor(cursor) if cursor else None
+    conn = get_db_connection()
+    cursor_obj = conn.cursor()
+
+    where, params, fts_query = _job_filter_clause(filters, cursor_obj)
+    source, source_params = _jobs_source(fts_query, _archived(filters))
+    ranked = bool(fts_query)
+    if position:
+        if isinstance(position[0], str) == ranked:
+            release_db_connection(conn)
+            raise ValueError("Invalid cursor")
+        if ranked:
+            where += " AND (matches.rank, jobs.id) > (?, ?)"
+        else:
+            where += " AND (jobs.created_at, jobs.id) < (?, ?)"
+        params.extend(position)
+
+    if ranked:
+        columns += ", matches.rank AS search_rank"
+        order = "matches.rank, jobs.id"
+    else:
+        order = "jobs.created_at DESC, jobs.id DESC"
+    query = f"SELECT {columns}{source}{where} ORDER BY {order} LIMIT ?"
+    params.append(limit + 1)
+
+    cursor_obj.execute(query, source_params + params)
+    jobs = [dict(row) for row in cursor_obj.fetchall()]
+    release_db_connection(conn)
+
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        last = jobs[-1]
+        sort_key = last["search_rank"] if ranked else last["created_at"]
+        next_cursor = encode_job_cursor(sort_key, last["id"])
+    if ranked:
+        for job in jobs:
+            del job["search_rank"]
+    return jobs, next_cursor
+
+
+def get_jobs_after(job_id, limit=100):
+    """Get jobs with an id greater than job_id, oldest first."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM jobs WHERE id > ? ORDER BY id LIMIT ?", (job_id, limit))
+    jobs = [dict(row) for row in cursor.fetchall()]
+    release_db_connection(conn)
+    return jobs
+
+
+def get_max_job_id():
+    """Get the id of the most recently inserted job (0 if there are none)."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM jobs")
+    job_id = cursor.fetchone()[0]
+    release_db_connection(conn)
+    return job_id
+
+
+def count_jobs(filters=None):
+    """Count jobs matching the filters without loading them."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    where, params, fts_query = _job_filter_clause(filters, cursor)
+    source, source_params = _jobs_source(fts_query, _archived(filters))
+    cursor.execute(f"SELECT COUNT(*){source}{where}", source_params + params)
+    count = cursor.fetchone()[0]
+    release_db_connection(conn)
+    return count
+
+
 def get_new_jobs():
     """Get all jobs marked as new."""
     conn = get_db_connection()
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM jobs WHERE is_new = 1 ORDER BY created_at DESC")
     jobs = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    release_db_connection(conn)
     return jobs
 
 
@@ -165,19 +1086,263 @@ def mark_jobs_as_viewed():
     cursor = conn.cursor()
     cursor.execute("UPDATE jobs SET is_new = 0 WHERE is_new = 1")
     conn.commit()
-    conn.close()
+    release_db_connection(conn)
+    notify_data_change()
+
+
+def archive_old_jobs(hot_days, batch_size=ARCHIVE_BATCH_SIZE):
+    """
+    Move jobs created more than hot_days ago from jobs to jobs_archive.
+
+    Jobs move oldest first in batches of batch_size, one short transaction
+    each, so scraper writes are never blocked for long. Their fingerprints
+    are dropped, and the job_stats and full-text triggers take them out of
+    the hot counters and search index. Returns the ids of the archived jobs.
+    """
+    columns = ", ".join(JOB_FIELDS)
+    archived = []
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        while True:
+            cursor.execute(
+                "SELECT id FROM jobs WHERE created_at < datetime('now', ?) ORDER BY created_at, id LIMIT ?",
+                (f"-{int(hot_days)} days", batch_size),
+            )
+            ids = [row["id"] for row in cursor.fetchall()]
+            if not ids:
+                break
+            marks = ",".join("?" * len(ids))
+            cursor.execute(
+                f"INSERT OR IGNORE INTO jobs_archive ({columns}) SELECT {columns} FROM jobs WHERE id IN ({marks})",
+                ids,
+            )
+            cursor.execute(f"DELETE FROM job_fingerprints WHERE job_id IN ({marks})", ids)
+            cursor.execute(f"DELETE FROM jobs WHERE id IN ({marks})", ids)
+            conn.commit()
+            archived.extend(ids)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        release_db_connection(conn)
+
+    if archived:
+        notify_data_change()
+    return archived
+
+
+def prune_email_history(days):
+    """Delete notification log rows and sent or failed outbox emails older than days. Returns rows deleted."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cutoff = f"-{int(days)} days"
+    cursor.execute("DELETE FROM email_notifications_log WHERE sent_at < datetime('now', ?)", (cutoff,))
+    deleted = cursor.rowcount
+    cursor.execute(
+        "DELETE FROM email_outbox WHERE status IN ('sent', 'failed') AND created_at < datetime('now', ?)",
+        (cutoff,),
+    )
+    deleted += cursor.rowcount
+    conn.commit()
+    release_db_connection(conn)
+    return deleted
+
+
+def incremental_vacuum(pages=VACUUM_PAGES_PER_STEP):
+    """
+    Return up to `pages` free pages to the filesystem.
+
+    Only works once the database uses auto_vacuum=INCREMENTAL (new databases
+    do; see vacuum_database for older ones). Returns the pages freed.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA auto_vacuum")
+    if cursor.fetchone()[0] != 2:
+        release_db_connection(conn)
+        return 0
+    cursor.execute("PRAGMA freelist_count")
+    before = cursor.fetchone()[0]
+    # executescript steps the pragma to completion; execute() frees one page.
+    conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+    cursor.execute("PRAGMA freelist_count")
+    freed = before - cursor.fetchone()[0]
+    release_db_connection(conn)
+    return freed
+
+
+def vacuum_database():
+    """Switch to auto_vacuum=INCREMENTAL and rebuild the file with a full VACUUM."""
+    conn = get_db_connection()
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("VACUUM")
+    release_db_connection(conn)
 
 
 def log_email_notification(job_id, email_to, email_subject):
     """Log email notification."""
+    log_email_notifications([job_id], email_to, email_subject)
+
+
+def log_email_notifications(job_ids, email_to, email_subject):
+    """Log one email notification row per job in a single transaction."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT INTO email_notifications_log (job_id, email_sent_to, email_subject) VALUES (?, ?, ?)",
+        [(job_id, email_to, email_subject) for job_id in job_ids],
+    )
+    conn.commit()
+    release_db_connection(conn)
+
+
+SUBSCRIPTION_RULE_FIELDS = ("keywords", "locations", "platforms", "experience_levels")
+
+
+def add_subscription(email, keywords=(), locations=(), platforms=(), experience_levels=()):
+    """Add an alert subscription. Returns the subscription id."""
     conn = get_db_connection()
     cursor = conn.cursor()
     cursor.execute(
+        "INSERT INTO subscriptions (email, keywords, locations, platforms, experience_levels) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (email, json.dumps(list(keywords)), json.dumps(list(locations)),
+         json.dumps(list(platforms)), json.dumps(list(experience_levels))),
+    )
+    subscription_id = cursor.lastrowid
+    conn.commit()
+    release_db_connection(conn)
+    return subscription_id
+
+
+def get_subscriptions(active_only=True):
+    """Get alert subscriptions with their rule lists decoded."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    query = "SELECT * FROM subscriptions"
+    if active_only:
+        query += " WHERE active = 1"
+    cursor.execute(query + " ORDER BY id")
+    subscriptions = [dict(row) for row in cursor.fetchall()]
+    release_db_connection(conn)
+    for subscription in subscriptions:
+        for field in SUBSCRIPTION_RULE_FIELDS:
+            subscription[field] = json.loads(subscription[field])
+    return subscriptions
+
+
+def delete_subscription(subscription_id):
+    """Delete a subscription. Returns True if it existed."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM subscriptions WHERE id = ?", (subscription_id,))
+    deleted = cursor.rowcount > 0
+    conn.commit()
+    release_db_connection(conn)
+    return deleted
+
+
+def enqueue_email(email_to, subject, body, job_ids):
+    """Add an email to the outbox. Returns the outbox id."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO email_outbox (email_to, subject, body, job_ids) VALUES (?, ?, ?, ?)",
+        (email_to, subject, body, json.dumps(job_ids)),
+    )
+    outbox_id = cursor.lastrowid
+    conn.commit()
+    release_db_connection(conn)
+    return outbox_id
+
+
+def get_due_emails(now, limit=20):
+    """
+    Get outbox emails whose next attempt is due, oldest first.
+
+    Includes 'sending' emails whose claim lease has expired (the sender
+    died mid-send). Claim each with claim_email before sending it.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT * FROM email_outbox WHERE status IN ('pending', 'sending') AND next_attempt_at <= ? "
+        "ORDER BY id LIMIT ?",
+        (now, limit),
+    )
+    emails = [dict(row) for row in cursor.fetchall()]
+    release_db_connection(conn)
+    for email in emails:
+        email["job_ids"] = json.loads(email["job_ids"])
+    return emails
+
+
+def claim_email(email_id, now, lease_until):
+    """
+    Claim a due outbox email for sending until lease_until.
+
+    The claim is a single conditional UPDATE, so of several senders (other
+    processes included) exactly one gets each email. Returns True if this
+    caller got it.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "UPDATE email_outbox SET status = 'sending', next_attempt_at = ? "
+        "WHERE id = ? AND status IN ('pending', 'sending') AND next_attempt_at <= ?",
+        (lease_until, email_id, now),
+    )
+    claimed = cursor.rowcount == 1
+    conn.commit()
+    release_db_connection(conn)
+    return claimed
+
+
+def get_next_email_due_time():
+    """Get the earliest next_attempt_at among pending or claimed emails, or None."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT MIN(next_attempt_at) FROM email_outbox WHERE status IN ('pending', 'sending')")
+    due = cursor.fetchone()[0]
+    release_db_connection(conn)
+    return due
+
+
+def mark_email_sent(email):
+    """Mark an outbox email as sent and log it for each of its jobs, in one transaction."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "UPDATE email_outbox SET status = 'sent', attempts = attempts + 1, sent_at = CURRENT_TIMESTAMP "
+        "WHERE id = ?",
+        (email["id"],),
+    )
+    cursor.executemany(
         "INSERT INTO email_notifications_log (job_id, email_sent_to, email_subject) VALUES (?, ?, ?)",
-        (job_id, email_to, email_subject),
+        [(job_id, email["email_to"], email["subject"]) for job_id in email["job_ids"]],
     )
     conn.commit()
-    conn.close()
+    release_db_connection(conn)
+
+
+def mark_email_failed(email_id, error, next_attempt_at=None):
+    """Record a failed send. The email is retried at next_attempt_at, or given up if None."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    if next_attempt_at is None:
+        cursor.execute(
+            "UPDATE email_outbox SET status = 'failed', attempts = attempts + 1, last_error = ? WHERE id = ?",
+            (error, email_id),
+        )
+    else:
+        cursor.execute(
+            "UPDATE email_outbox SET status = 'pending', attempts = attempts + 1, last_error = ?, next_attempt_at = ? "
+            "WHERE id = ?",
+            (error, next_attempt_at, email_id),
+        )
+    conn.commit()
+    release_db_connection(conn)
 
 
 def update_source_status(platform_name, status="active"):
@@ -190,4 +1355,76 @@ def update_source_status(platform_name, status="active"):
         (platform_name, status),
     )
     conn.commit()
-    conn.close()
+    release_db_connection(conn)
+
+
+def get_http_cache_entry(url):
+    """Get the cached validators and content hash for a URL, or None."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM http_cache WHERE url = ?", (url,))
+    row = cursor.fetchone()
+    release_db_connection(conn)
+    return dict(row) if row else None
+
+
+def save_http_cache_entry(url, etag, last_modified, content_hash):
+    """Store the validators and content hash of the latest response for a URL."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, content_hash, updated_at) "
+        "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
+        (url, etag, last_modified, content_hash),
+    )
+    conn.commit()
+    release_db_connection(conn)
+
+
+def get_scrape_watermark(platform_name, query_key):
+    """Get the watermark job hash of a search, or None."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT job_hash FROM scrape_watermarks WHERE platform_name = ? AND query_key = ?",
+        (platform_name, query_key),
+    )
+    row = cursor.fetchone()
+    release_db_connection(conn)
+    return row["job_hash"] if row else None
+
+
+def save_scrape_watermark(platform_name, query_key, job_hash):
+    """Store the newest job hash seen for a search."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT OR REPLACE INTO scrape_watermarks (platform_name, query_key, job_hash, updated_at) "
+        "VALUES (?, ?, ?, CURRENT_TIMESTAMP)",
+        (platform_name, query_key, job_hash),
+    )
+    conn.commit()
+    release_db_connection(conn)
+
+
+def get_source_schedules():
+    """Get the persisted adaptive schedule of every platform."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM source_schedule")
+    rows = [dict(row) for row in cursor.fetchall()]
+    release_db_connection(conn)
+    return rows
+
+
+def save_source_schedule(platform_name, interval_seconds, yield_rate, last_run_at, next_run_at):
+    """Store a platform's adaptive schedule."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT OR REPLACE INTO source_schedule "
+        "(platform_name, interval_seconds, yield_rate, last_run_at, next_run_at) VALUES (?, ?, ?, ?, ?)",
+        (platform_name, interval_seconds, yield_rate, last_run_at, next_run_at),
+    )
+    conn.commit()
+    release_db_connection(conn)
@@ -0,0 +1,258 @@
+"""Cross-platform near-duplicate detection for scraped jobs.
+
+Each job gets a 64-bit SimHash of its normalized title, company and
+location. Fingerprints are split into four 16-bit bands and kept in one
+hash table per band: two fingerprints within NEAR_DUPLICATE_MAX_HAMMING
+(at most 3) bits of each other must agree on at least one band, so a lookup
+only compares against the few jobs sharing a band value. Candidates are then
+verified before a job is treated as a duplicate and linked to the canonical
+job instead of being inserted: it must come from another platform and have
+the same company, a similar title and an overlapping location.
+"""
+import hashlib
+import re
+import threading
+from collections import defaultdict
+
+from config import (
+    NEAR_DUPLICATE_DETECTION,
+    NEAR_DUPLICATE_MAX_HAMMING,
+    NEAR_DUPLICATE_TITLE_SIMILARITY,
+)
+from backend.database import (
+    generate_job_hash,
+    get_job_fingerprints,
+    get_jobs_without_fingerprints,
+    insert_jobs,
+    link_duplicate_jobs,
+    save_job_fingerprints,
+)
+from backend.seen_hashes import seen_hashes
+
+BANDS = 4
+BAND_BITS = 16
+BAND_MASK = (1 << BAND_BITS) - 1
+
+# Legal-form words that differ between platforms for the same employer.
+COMPANY_SUFFIXES = {
+    "co", "company", "corp", "corporation", "gmbh", "inc", "limited", "llc",
+    "llp", "ltd", "plc", "private", "pvt",
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _tokens(text):
+    return _WORD_RE.findall((text or "").lower())
+
+
+def _feature_hash(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(weighted_features):
+    """64-bit SimHash of (feature, weight) pairs."""
+    totals = [0] * 64
+    for feature, weight in weighted_features:
+        h = _feature_hash(feature)
+        for bit in range(64):
+            totals[bit] += weight if h >> bit & 1 else -weight
+    return sum(1 << bit for bit in range(64) if totals[bit] > 0)
+
+
+class Fingerprint:
+    """Normalized keys and SimHash for one job."""
+
+    __slots__ = ("simhash", "company_key", "title_key", "location_key", "platform")
+
+    def __init__(self, simhash_value, company_key, title_key, location_key, platform):
+        self.simhash = simhash_value
+        self.company_key = company_key
+        self.title_key = title_key
+        self.location_key = location_key
+        self.platform = platform
+
+    @classmethod
+    def from_job(cls, job):
+        company = [t for t in _tokens(job.get("company_name")) if t not in COMPANY_SUFFIXES]
+        title = _tokens(job.get("job_title"))
+        location = _tokens(job.get("location"))
+        features = (
+            [(f"c:{t}", 3) for t in company]
+            + [(f"t:{t}", 2) for t in title]
+            + [(f"l:{t}", 1) for t in location]
+        )
+        return cls(
+            simhash(features),
+            " ".join(company),
+            " ".join(sorted(set(title))),
+            " ".join(sorted(set(location))),
+            job.get("source_platform") or "",
+        )
+
+    def bands(self):
+        return [(self.simhash >> (band * BAND_BITS)) & BAND_MASK for band in range(BANDS)]
+
+    def is_near_duplicate(self, other):
+        """
+        Verify a band candidate: another platform, same company, similar title, overlapping location.
+
+        Similar postings on one platform are separate openings, and a job
+        without a location cannot be shown to be in the same place.
+        """
+        if self.platform == other.platform:
+            return False
+        if bin(self.simhash ^ other.simhash).count("1") > NEAR_DUPLICATE_MAX_HAMMING:
+            return False
+        if self.company_key != other.company_key:
+            return False
+
+        title_a, title_b = set(self.title_key.split()), set(other.title_key.split())
+        if title_a or title_b:
+            if len(title_a & title_b) / len(title_a | title_b) < NEAR_DUPLICATE_TITLE_SIMILARITY:
+                return False
+
+        loc_a, loc_b = set(self.location_key.split()), set(other.location_key.split())
+        return bool(loc_a & loc_b)
+
+
+class NearDuplicateIndex:
+    """In-memory banded SimHash index of stored jobs, backed by job_fingerprints."""
+
+    def __init__(self):
+        self.fingerprints = {}
+        self.bands = [defaultdict(list) for _ in range(BANDS)]
+        self.loaded = False
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def add(self, job_id, fingerprint):
+        self.fingerprints[job_id] = fingerprint
+        for band, value in enumerate(fingerprint.bands()):
+            self.bands[band][value].append(job_id)
+
+    def remove(self, job_id):
+        fingerprint = self.fingerprints.pop(job_id, None)
+        if fingerprint is None:
+            return
+        for band, value in enumerate(fingerprint.bands()):
+            bucket = self.bands[band].get(value)
+            if bucket and job_id in bucket:
+                bucket.remove(job_id)
+
+    def find(self, fingerprint):
+        """Return the id of a stored near-duplicate (the oldest one), or None."""
+        seen = set()
+        best = None
+        for band, value in enumerate(fingerprint.bands()):
+            for job_id in self.bands[band].get(value, ()):
+                if job_id in seen:
+                    continue
+                seen.add(job_id)
+                if (best is None or job_id < best) and fingerprint.is_near_duplicate(self.fingerprints[job_id]):
+                    best = job_id
+        return best
+
+    def load(self):
+        """Warm the index from SQLite, fingerprinting any jobs stored before it existed."""
+        if self.loaded:
+            return
+        for row in get_job_fingerprints():
+            self.add(row["job_id"], Fingerprint(
+                row["simhash"] & (2**64 - 1), row["company_key"], row["title_key"], row["location_key"],
+                row["source_platform"],
+            ))
+
+        last_id = 0
+        while True:
+            jobs = get_jobs_without_fingerprints(after_id=last_id, limit=1000)
+            if not jobs:
+                break
+            last_id = jobs[-1]["id"]
+            rows = []
+            for job in jobs:
+                fingerprint = Fingerprint.from_job(job)
+                self.add(job["id"], fingerprint)
+                rows.append((job["id"], fingerprint))
+            save_job_fingerprints(rows)
+        self.loaded = True
+
+
+def drop_repeats(jobs):
+    """Keep the first of each job seen more than once in a run (same job_hash), in order."""
+    unique = {}
+    for job in jobs:
+        unique.setdefault(generate_job_hash(job["job_url"], job["job_title"], job["company_name"]), job)
+    return list(unique.values())
+
+
+def ingest_jobs(jobs, index, seen=seen_hashes):
+    """
+    Insert scraped jobs, linking near-duplicates to their canonical job.
+
+    Jobs whose hash is already in `seen` are dropped without a database
+    round trip. Of the rest, near-duplicates of a stored job, or of an
+    earlier job in the same batch, are recorded in job_duplicates instead of
+    jobs. Returns a list aligned with `jobs` holding the new job id, or None
+    for jobs that were duplicates (exact or near).
+    """
+    unseen = seen.filter_unseen(jobs)
+    fresh = [job for _, job, _ in unseen]
+    if NEAR_DUPLICATE_DETECTION:
+        fresh_ids = _ingest_unseen(fresh, index)
+    else:
+        fresh_ids = insert_jobs(fresh)
+
+    results = [None] * len(jobs)
+    for (position, _, job_hash), job_id in zip(unseen, fresh_ids):
+        results[position] = job_id
+        seen.add(job_hash)
+    return results
+
+
+def _ingest_unseen(jobs, index):
+    if not jobs:
+        return []
+
+    with index.lock:
+        index.load()
+
+        unique, unique_fingerprints, positions = [], [], []
+        links = []  # (job, canonical job id, or index into `unique`)
+        batch = NearDuplicateIndex()
+        for position, job in enumerate(jobs):
+            fingerprint = Fingerprint.from_job(job)
+            canonical = index.find(fingerprint)
+            if canonical is not None:
+                links.append((job, canonical, False))
+                continue
+            in_batch = batch.find(fingerprint)
+            if in_batch is not None:
+                links.append((job, in_batch, True))
+                continue
+            batch.add(len(unique), fingerprint)
+            unique.append(job)
+            unique_fingerprints.append(fingerprint)
+            positions.append(position)
+
+        unique_ids = insert_jobs(unique)
+
+        results = [None] * len(jobs)
+        new_fingerprints = []
+        for position, job_id, fingerprint in zip(positions, unique_ids, unique_fingerprints):
+            if job_id:
+                results[position] = job_id
+                index.add(job_id, fingerprint)
+                new_fingerprints.append((job_id, fingerprint))
+        save_job_fingerprints(new_fingerprints)
+
+        resolved = []
+        for job, canonical, in_batch in links:
+            canonical_id = unique_ids[canonical] if in_batch else canonical
+            if canonical_id:
+                resolved.append((job, canonical_id))
+        link_duplicate_jobs(resolved)
+
+    return results
@@ -1,5 +1,12 @@
-"""SMTP-based email notification service."""
+"""SMTP-based email notification service.
+
+Alerts are written to a durable outbox table and delivered by a background
+sender thread over a reused SMTP session, so scraping never waits on mail.
+"""
+import random
 import smtplib
+import threading
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -7,13 +14,71 @@ from config import (
     ALERT_KEYWORDS,
     ALERT_LOCATIONS,
     EMAIL_FROM,
+    EMAIL_MAX_ATTEMPTS,
+    EMAIL_OUTBOX_POLL_SECONDS,
+    EMAIL_RETRY_BASE_SECONDS,
+    EMAIL_SEND_LEASE_SECONDS,
     EMAIL_TO,
+    SMTP_IDLE_TIMEOUT_SECONDS,
     SMTP_PASSWORD,
     SMTP_PORT,
     SMTP_SERVER,
     SMTP_USERNAME,
 )
-from backend.database import log_email_notification
+from backend.alert_matcher import AlertMatcher
+from backend.alert_router import AlertRouter
+from backend.database import (
+    claim_email,
+    enqueue_email,
+    get_due_emails,
+    get_next_email_due_time,
+    get_subscriptions,
+    mark_email_failed,
+    mark_email_sent,
+)
+
+
+class SmtpSession:
+    """An authenticated SMTP connection that is reused across messages."""
+
+    def __init__(self, server, port, username, password):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.smtp = None
+        self.last_used = 0.0
+
+    def _connect(self):
+        smtp = smtplib.SMTP(self.server, self.port, timeout=30)
+        smtp.starttls()
+        smtp.login(self.username, self.password)
+        self.smtp = smtp
+
+    def send(self, msg):
+        """Send a message, reconnecting once if the session has gone away."""
+        if self.smtp is None:
+            self._connect()
+        try:
+            self.smtp.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self.close()
+            self._connect()
+            self.smtp.send_message(msg)
+        self.last_used = time.monotonic()
+
+    def close_if_idle(self):
+        if self.smtp is not None and time.monotonic() - self.last_used > SMTP_IDLE_TIMEOUT_SECONDS:
+            self.close()
+
+    def close(self):
+        if self.smtp is None:
+            return
+        try:
+            self.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self.smtp = None
 
 
 class EmailService:
@@ -26,41 +91,30 @@ class EmailService:
         self.password = SMTP_PASSWORD
         self.email_from = EMAIL_FROM
         self.email_to = EMAIL_TO
+        self.matcher = AlertMatcher(ALERT_KEYWORDS, ALERT_LOCATIONS)
+        self.session = SmtpSession(self.smtp_server, self.smtp_port, self.username, self.password)
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._wakeup = threading.Event()
 
     def should_send_alert(self, job):
         """Check if job matches alert criteria (keywords and/or locations)."""
-        if not ALERT_KEYWORDS and not ALERT_LOCATIONS:
-            return True
-
-        job_title_lower = (job.get("job_title") or "").lower()
-        location_lower = (job.get("location") or "").lower()
+        return self.matcher.match(job) is not None
 
-        if ALERT_KEYWORDS:
-            if not any(kw.lower() in job_title_lower for kw in ALERT_KEYWORDS if kw):
-                return False
-
-        if ALERT_LOCATIONS:
-            if not any(loc.lower() in location_lower for loc in ALERT_LOCATIONS if loc):
-                return False
-
-        return True
+    def _is_configured(self, email_to=None):
+        return bool(self.email_from and (email_to or self.email_to) and self.username and self.password)
 
     def send_job_alert(self, job):
-        """Send email alert for a single job."""
+        """Queue an email alert for a single job."""
         if not self.should_send_alert(job):
             return False
 
-        if not self.email_from or not self.email_to or not self.username or not self.password:
+        if not self._is_configured():
             print("  Email configuration missing. Skipping email alert.")
             return False
 
-        try:
-            msg = MIMEMultipart()
-            msg["From"] = self.email_from
-            msg["To"] = self.email_to
-            msg["Subject"] = f"New Job: {job['job_title']} at {job['company_name']}"
-
-            body = f"""
+        subject = f"New Job: {job['job_title']} at {job['company_name']}"
+        body = f"""
 New Job Opportunity Found!
 
 Job Title: {job['job_title']}
@@ -76,61 +130,132 @@ Apply here: {job['job_url']}
 ---
 Automated notification from Job Notification Tracker.
 """
-            msg.attach(MIMEText(body, "plain"))
-
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
+        self._queue(subject, body, [job.get("id")])
+        print(f"  Email alert queued for: {job['job_title']}")
+        return True
 
-            log_email_notification(job.get("id"), self.email_to, msg["Subject"])
-            print(f"  Email alert sent for: {job['job_title']}")
-            return True
+    def send_alerts(self, jobs):
+        """
+        Queue this cycle's digests for new jobs.
 
-        except Exception as e:
-            print(f"  Error sending email: {e}")
+        EMAIL_TO (if set) gets the digest for the global ALERT_KEYWORDS and
+        ALERT_LOCATIONS, and every subscriber gets one digest of the jobs
+        matching their own rules.
+        """
+        if not jobs:
             return False
 
-    def send_batch_alert(self, jobs):
-        """Send batched email alert for multiple jobs."""
+        sent = False
+        if self.email_to:
+            sent = self.send_batch_alert(jobs)
+
+        subscriptions = get_subscriptions()
+        if subscriptions:
+            for email, matches in AlertRouter(subscriptions).route(jobs).items():
+                sent = self.send_batch_alert([job for job, _ in matches], email_to=email, matches=matches) or sent
+        return sent
+
+    def send_batch_alert(self, jobs, email_to=None, matches=None):
+        """
+        Queue a batched email alert for multiple jobs.
+
+        Sends to email_to (default EMAIL_TO). `matches` is a list of
+        (job, matched_rules) pairs already filtered by the caller; without it
+        the jobs are filtered with the global alert rules.
+        """
         if not jobs:
             return False
 
-        if not self.email_from or not self.email_to or not self.username or not self.password:
+        if not self._is_configured(email_to):
             print("  Email configuration missing. Skipping batch alert.")
             return False
 
-        filtered = [j for j in jobs if self.should_send_alert(j)]
-        if not filtered:
+        if matches is None:
+            matches = self.matcher.filter(jobs)
+        if not matches:
             return False
 
-        try:
-            msg = MIMEMultipart()
-            msg["From"] = self.email_from
-            msg["To"] = self.email_to
-            msg["Subject"] = f"Job Alert: {len(filtered)} New Job(s) Found"
-
-            body = f"Found {len(filtered)} new job(s):\n\n"
-            for idx, job in enumerate(filtered, 1):
-                body += f"{idx}. {job['job_title']} at {job['company_name']}\n"
-                body += f"   Location: {job.get('location', 'N/A')}\n"
-                body += f"   Source: {job['source_platform']}\n"
-                body += f"   Apply: {job['job_url']}\n\n"
-
-            body += "\n---\nAutomated notification from Job Notification Tracker."
-            msg.attach(MIMEText(body, "plain"))
-
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
-
-            for job in filtered:
-                log_email_notification(job.get("id"), self.email_to, msg["Subject"])
-
-            print(f"  Batch email sent for {len(filtered)} job(s)")
-            return True
-
-        except Exception as e:
-            print(f"  Error sending batch email: {e}")
-            return False
+        subject = f"Job Alert: {len(matches)} New Job(s) Found"
+        body = f"Found {len(matches)} new job(s):\n\n"
+        for idx, (job, matched) in enumerate(matches, 1):
+            body += f"{idx}. {job['job_title']} at {job['company_name']}\n"
+            body += f"   Location: {job.get('location', 'N/A')}\n"
+            body += f"   Source: {job['source_platform']}\n"
+            rules = matched["keywords"] + matched["locations"]
+            if rules:
+                body += f"   Matched: {', '.join(rules)}\n"
+            body += f"   Apply: {job['job_url']}\n\n"
+
+        body += "\n---\nAutomated notification from Job Notification Tracker."
+        self._queue(subject, body, [job.get("id") for job, _matched in matches], email_to)
+        print(f"  Batch email queued for {len(matches)} job(s) to {email_to or self.email_to}")
+        return True
+
+    def _queue(self, subject, body, job_ids, email_to=None):
+        """Store an email in the outbox and wake the sender."""
+        enqueue_email(email_to or self.email_to, subject, body, job_ids)
+        self.start_worker()
+        self._wakeup.set()
+
+    def start_worker(self):
+        """Start the outbox sender thread if it is not already running."""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run_worker, daemon=True, name="email-outbox")
+                self._worker.start()
+
+    def _run_worker(self):
+        while True:
+            self._wakeup.clear()
+            try:
+                self.deliver_due_emails()
+                due = get_next_email_due_time()
+            except Exception as e:
+                print(f"  Error processing email outbox: {e}")
+                due = None
+
+            wait = EMAIL_OUTBOX_POLL_SECONDS if due is None else min(EMAIL_OUTBOX_POLL_SECONDS, due - time.time())
+            self._wakeup.wait(max(0.0, wait))
+            self.session.close_if_idle()
+
+    def deliver_due_emails(self):
+        """
+        Send every due outbox email over the shared SMTP session.
+
+        Each email is claimed before it is sent, so a second sender (another
+        process) never delivers it too; a claim whose sender dies lapses
+        after EMAIL_SEND_LEASE_SECONDS and the email is sent again.
+        """
+        while True:
+            emails = get_due_emails(time.time())
+            if not emails:
+                return
+
+            for email in emails:
+                now = time.time()
+                if not claim_email(email["id"], now, now + EMAIL_SEND_LEASE_SECONDS):
+                    continue
+
+                msg = MIMEMultipart()
+                msg["From"] = self.email_from
+                msg["To"] = email["email_to"]
+                msg["Subject"] = email["subject"]
+                msg.attach(MIMEText(email["body"], "plain"))
+
+                try:
+                    self.session.send(msg)
+                except Exception as e:
+                    self.session.close()
+                    attempts = email["attempts"] + 1
+                    if attempts >= EMAIL_MAX_ATTEMPTS:
+                        print(f"  Giving up on email {email['id']} after {attempts} attempts: {e}")
+                        mark_email_failed(email["id"], str(e))
+                    else:
+                        delay = EMAIL_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+                        mark_email_failed(email["id"], str(e), time.time() + random.uniform(delay / 2, delay))
+                        print(f"  Error sending email {email['id']}, will retry: {e}")
+                    # The server is likely unavailable; retry the rest later.
+                    return
+
+                mark_email_sent(email)
+                print(f"  Email sent: {email['subject']}")
@@ -0,0 +1,77 @@
+"""Plans the search queries each scrape cycle runs from the alert configuration and subscriptions."""
+from collections import namedtuple
+
+from config import ALERT_KEYWORDS, ALERT_LOCATIONS
+
+# Searched when no alert keywords are configured.
+DEFAULT_KEYWORDS = ["developer"]
+
+
+class SearchQuery(namedtuple("SearchQuery", ["keywords", "location"])):
+    """One platform search: keywords plus an optional location ("" for anywhere)."""
+
+    __slots__ = ()
+
+    @property
+    def key(self):
+        """Stable identifier, used for per-query state such as watermarks."""
+        return f"{self.keywords}|{self.location}"
+
+
+def _normalize(term):
+    return " ".join(term.lower().split())
+
+
+def merge_terms(terms):
+    """
+    Drop duplicate terms and terms made redundant by a broader one.
+
+    A term is redundant when another term's words are a subset of its words:
+    results for "developer" already include "python developer", and the
+    alert matcher would accept those jobs through "developer" anyway.
+    Returns normalized terms in their configured order.
+    """
+    unique = list(dict.fromkeys(_normalize(t) for t in terms if t and t.strip()))
+    words = {term: set(term.split()) for term in unique}
+    return [
+        term for term in unique
+        if not any(other != term and words[other] < words[term] for other in unique)
+    ]
+
+
+def plan_queries(keywords=None, locations=None, subscriptions=(), platform=None):
+    """
+    Build the search list from each rule set's keyword x location pairs.
+
+    Rule sets are the alert configuration (or the given keywords and
+    locations) plus each subscription; with platform, only subscriptions
+    that cover it count. A rule set without locations searches its keywords
+    anywhere. Pairs are never crossed between rule sets, and a pair is
+    dropped when another pair's keyword and location are both broader
+    ("python developer" in "pune" is covered by "developer" anywhere).
+    """
+    rule_sets = [(
+        ALERT_KEYWORDS if keywords is None else keywords,
+        ALERT_LOCATIONS if locations is None else locations,
+    )]
+    for subscription in subscriptions:
+        platforms = {p.lower() for p in subscription["platforms"]}
+        if platform is None or not platforms or platform.lower() in platforms:
+            rule_sets.append((subscription["keywords"], subscription["locations"]))
+
+    pairs = {}
+    for rule_keywords, rule_locations in rule_sets:
+        for keyword in merge_terms(rule_keywords):
+            for location in merge_terms(rule_locations) or [""]:
+                pairs.setdefault((keyword, location), (set(keyword.split()), set(location.split())))
+    if not pairs:
+        return [SearchQuery(keyword, "") for keyword in DEFAULT_KEYWORDS]
+
+    return [
+        SearchQuery(keyword, location)
+        for (keyword, location), (words, places) in pairs.items()
+        if not any(
+            other != (keyword, location) and other_words <= words and other_places <= places
+            for other, (other_words, other_places) in pairs.items()
+        )
+    ]
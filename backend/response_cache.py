@@ -0,0 +1,45 @@
+"""Bounded LRU cache of serialized API responses."""
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of (body, etag) pairs.
+
+    Keys include the data generation (see database.get_data_generation), so
+    entries for older data are never served and simply age out.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached (body, etag) for key, or None."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, body):
+        """Cache a serialized body. Returns the stored (body, etag) pair."""
+        entry = (body, hashlib.sha256(body).hexdigest())
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
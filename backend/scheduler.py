@@ -1,16 +1,88 @@
-"""Scheduler for running scrapers at fixed intervals."""
-import schedule
+"""Scheduler for running scrapers at adaptive per-platform intervals."""
 import threading
 import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from config import SCRAPING_INTERVAL_HOURS
-from backend.database import insert_job, update_source_status
+from config import (
+    ARCHIVE_INTERVAL_HOURS,
+    EMAIL_LOG_RETENTION_DAYS,
+    JOB_HOT_RETENTION_DAYS,
+    SCRAPE_RUN_HISTORY,
+    SCRAPER_MAX_WORKERS,
+    SEARCH_MAX_PAGES,
+)
+from backend.database import (
+    archive_old_jobs,
+    get_subscriptions,
+    incremental_vacuum,
+    prune_email_history,
+    update_source_status,
+)
+from backend.dedupe import NearDuplicateIndex, drop_repeats, ingest_jobs
+from backend.query_planner import plan_queries
+from backend.seen_hashes import seen_hashes
+from backend.source_schedule import DeadlineQueue, load_source_schedules
 from backend.email_service import EmailService
 from backend.scrapers import IndeedScraper, LinkedInScraper, NaukriScraper
 
 
+class ScrapeRun:
+    """Progress of one scrape_all_platforms run, as reported by /api/scrape/<run_id>."""
+
+    def __init__(self, platform_names):
+        self.id = uuid.uuid4().hex[:12]
+        self.status = "queued"
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.error = None
+        self.new_jobs_count = 0
+        self.platforms = {}
+        self.lock = threading.Lock()
+        self.add_platforms(platform_names)
+
+    def add_platforms(self, names):
+        """Add platforms to a run that has not started yet."""
+        with self.lock:
+            for name in names:
+                self.platforms.setdefault(
+                    name, {"status": "pending", "duration_seconds": None, "queries": 0, "jobs_found": 0, "new_jobs": 0},
+                )
+
+    def update_platform(self, name, **fields):
+        with self.lock:
+            self.platforms[name].update(fields)
+
+    def to_dict(self):
+        with self.lock:
+            done = sum(1 for p in self.platforms.values() if p["status"] not in ("pending", "running"))
+            return {
+                "run_id": self.id,
+                "status": self.status,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "progress": {"completed": done, "total": len(self.platforms)},
+                "platforms": {name: dict(p) for name, p in self.platforms.items()},
+                "new_jobs_count": self.new_jobs_count,
+                "error": self.error,
+            }
+
+
+# Deadline queue task for archival; every other task is a platform name.
+RETENTION_TASK = "retention"
+
+
 class JobScheduler:
-    """Scheduler for running scrapers at intervals."""
+    """
+    Scheduler for running scrapers at intervals.
+
+    Each platform has its own deadline in a priority queue, recomputed after
+    every scrape from its recent new-job yield (see SourceSchedule), and the
+    scheduler thread sleeps until exactly the earliest one.
+    """
 
     def __init__(self):
         self.scrapers = [
@@ -19,55 +91,243 @@ class JobScheduler:
             NaukriScraper(),
         ]
         self.email_service = EmailService()
+        self.near_duplicates = NearDuplicateIndex()
         self.running = False
+        self.runs = OrderedDict()
+        self.current_run = None
+        self.queued_run = None
+        self.runs_lock = threading.Lock()
+        self.deadlines = DeadlineQueue()
+        self.source_schedules = {}
 
-    def scrape_all_platforms(self):
-        """Scrape jobs from all platforms and send alerts for new ones."""
-        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Starting scheduled scraping...")
-        new_jobs = []
+    def trigger_scrape(self, platform_names=None):
+        """
+        Start a scrape in the background, or join the one already in flight.
+
+        Scrapes every platform, or only those in platform_names. While a run
+        is in flight, the call joins it if it covers every requested
+        platform; otherwise the platforms it lacks go into a follow-up run
+        that starts when it finishes. Returns (run, started); started is
+        False when the call was merged into a run that was already queued
+        or running.
+        """
+        names = [
+            scraper.platform_name for scraper in self.scrapers
+            if platform_names is None or scraper.platform_name in platform_names
+        ]
+        with self.runs_lock:
+            current = self.current_run
+            if current is None:
+                run = self.current_run = self._new_run(names)
+            else:
+                missing = [name for name in names if name not in current.platforms]
+                if not missing:
+                    return current, False
+                if self.queued_run is not None:
+                    self.queued_run.add_platforms(missing)
+                    return self.queued_run, False
+                self.queued_run = self._new_run(missing)
+                return self.queued_run, True
+
+        self._start_run(run)
+        return run, True
+
+    def _new_run(self, names):
+        """Create a run and add it to the history; the caller holds runs_lock."""
+        run = ScrapeRun(names)
+        self.runs[run.id] = run
+        while len(self.runs) > SCRAPE_RUN_HISTORY:
+            self.runs.popitem(last=False)
+        return run
+
+    def _start_run(self, run):
+        threading.Thread(target=self._execute_run, args=(run,), daemon=True, name=f"scrape-{run.id}").start()
+
+    def get_run(self, run_id):
+        """Return a recent ScrapeRun by id, or None."""
+        with self.runs_lock:
+            return self.runs.get(run_id)
+
+    def ingest_stats(self):
+        """Size and accuracy of the in-memory structures consulted before inserting jobs."""
+        return {
+            "seen_hashes": seen_hashes.stats(),
+            "near_duplicates": {"fingerprints": len(self.near_duplicates)},
+        }
 
-        for scraper in self.scrapers:
-            try:
-                print(f"  Scraping {scraper.platform_name}...")
-                jobs = scraper.fetch_jobs(keywords="developer", location="", max_pages=1)
+    def run_retention(self):
+        """Archive jobs past the hot window, prune old email history and free the space."""
+        try:
+            archived = archive_old_jobs(JOB_HOT_RETENTION_DAYS)
+            with self.near_duplicates.lock:
+                for job_id in archived:
+                    self.near_duplicates.remove(job_id)
+            pruned = prune_email_history(EMAIL_LOG_RETENTION_DAYS)
+            freed = incremental_vacuum()
+            if archived or pruned or freed:
+                print(f"  Retention: {len(archived)} jobs archived, {pruned} email rows pruned, {freed} pages freed")
+        except Exception as e:
+            print(f"  Retention failed: {e}")
 
-                for job in jobs:
-                    job_id = insert_job(job)
-                    if job_id:
-                        new_jobs.append({**job, "id": job_id})
-                        print(f"    New: {job['job_title']} at {job['company_name']}")
+    def _warm_up(self):
+        """Load the seen-hash set and near-duplicate index so the first scrape does not wait on them."""
+        try:
+            seen_hashes.load()
+            with self.near_duplicates.lock:
+                self.near_duplicates.load()
+        except Exception as e:
+            print(f"  Warming ingest caches failed: {e}")
 
-                update_source_status(scraper.platform_name, "active")
-                print(f"  {scraper.platform_name}: {len(jobs)} jobs found")
-            except Exception as e:
-                print(f"  Error scraping {scraper.platform_name}: {e}")
-                update_source_status(scraper.platform_name, "error")
+    def schedule_status(self):
+        """Adaptive interval, yield rate and next run time of each platform."""
+        return {name: schedule.to_dict() for name, schedule in self.source_schedules.items()}
 
+    def _execute_run(self, run):
+        scrapers = [scraper for scraper in self.scrapers if scraper.platform_name in run.platforms]
+        try:
+            self.scrape_all_platforms(run, scrapers)
+        except Exception as e:
+            print(f"  Scrape run {run.id} failed: {e}")
+            run.status = "failed"
+            run.error = str(e)
+            run.finished_at = time.time()
+        finally:
+            with self.runs_lock:
+                follow_up = self.current_run = self.queued_run
+                self.queued_run = None
+            if follow_up is not None:
+                self._start_run(follow_up)
+
+    def scrape_all_platforms(self, run=None, scrapers=None):
+        """Scrape jobs from all platforms (or the given scrapers) and send alerts for new ones.
+
+        Platforms are scraped in parallel on a bounded thread pool, so a cycle
+        takes about as long as the slowest platform. Set SCRAPER_MAX_WORKERS
+        to 1 to scrape them one after another. Progress is recorded on `run`
+        when one is given.
+        """
+        print(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Starting scheduled scraping...")
+        scrapers = scrapers or self.scrapers
+        run = run or ScrapeRun([scraper.platform_name for scraper in scrapers])
+        run.status = "running"
+        run.started_at = time.time()
+        new_jobs = []
+
+        workers = max(1, min(SCRAPER_MAX_WORKERS, len(scrapers)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as pool:
+            futures = [pool.submit(self._scrape_platform, scraper, run) for scraper in scrapers]
+            # Collect in submission order so the alert digest order is stable.
+            for future in futures:
+                new_jobs.extend(future.result())
+
+        run.new_jobs_count = len(new_jobs)
         if new_jobs:
-            self.email_service.send_batch_alert(new_jobs)
+            self.email_service.send_alerts(new_jobs)
 
+        run.status = "completed"
+        run.finished_at = time.time()
         print(f"  Done. {len(new_jobs)} new jobs added.\n")
         return new_jobs
 
+    def _scrape_platform(self, scraper, run):
+        """
+        Run every planned query on a single platform and store its jobs.
+
+        Queries are planned afresh each time, so subscription changes take
+        effect on the next scrape. They are fetched one after another under the platform's rate
+        limits while their pages parse in the parse pool; a job returned by
+        several queries is ingested once. Returns the new jobs.
+        """
+        new_jobs = []
+        name = scraper.platform_name
+        if scraper.circuit_breaker.is_open:
+            print(f"  Skipping {name}: circuit open after repeated failures")
+            update_source_status(name, "circuit_open")
+            run.update_platform(name, status="skipped")
+            self._reschedule(name, None)
+            return new_jobs
+
+        started = time.monotonic()
+        run.update_platform(name, status="running")
+        try:
+            queries = plan_queries(subscriptions=get_subscriptions(), platform=name)
+            print(f"  Scraping {name} ({len(queries)} queries)...")
+            result = scraper.search(
+                [(query.keywords, query.location) for query in queries], max_pages=SEARCH_MAX_PAGES,
+            )
+            jobs = drop_repeats(result.jobs)
+
+            for job, job_id in zip(jobs, ingest_jobs(jobs, self.near_duplicates)):
+                if job_id:
+                    new_jobs.append({**job, "id": job_id})
+                    print(f"    New: {job['job_title']} at {job['company_name']}")
+            # Only now that the jobs are stored may later runs skip their pages.
+            result.save_state()
+
+            status = "circuit_open" if scraper.circuit_breaker.is_open else "active"
+            update_source_status(name, status)
+            run.update_platform(
+                name, status="done", queries=len(queries), jobs_found=len(jobs), new_jobs=len(new_jobs),
+            )
+            print(f"  {name}: {len(jobs)} jobs found")
+            self._reschedule(name, len(new_jobs))
+        except Exception as e:
+            print(f"  Error scraping {name}: {e}")
+            update_source_status(name, "error")
+            run.update_platform(name, status="error", error=str(e))
+            self._reschedule(name, None)
+        run.update_platform(name, duration_seconds=round(time.monotonic() - started, 3))
+        return new_jobs
+
+    def _reschedule(self, name, new_jobs):
+        """Update a platform's adaptive interval and queue its next scheduled scrape."""
+        schedule = self.source_schedules.get(name)
+        if schedule is None:
+            return
+        try:
+            self.deadlines.push(name, schedule.record(new_jobs))
+        except Exception as e:
+            print(f"  Rescheduling {name} failed: {e}")
+
     def start(self):
         """Start the scheduler."""
         if self.running:
             return
 
         self.running = True
-        schedule.every(SCRAPING_INTERVAL_HOURS).hours.do(self.scrape_all_platforms)
+        threading.Thread(target=self._warm_up, daemon=True, name="ingest-warmup").start()
+        self.email_service.start_worker()
 
-        def run_scheduler():
-            while self.running:
-                schedule.run_pending()
-                time.sleep(60)
+        now = time.time()
+        planned = []
+        self.source_schedules = load_source_schedules([scraper.platform_name for scraper in self.scrapers])
+        for name, schedule in self.source_schedules.items():
+            # Deadlines persist across restarts; a new platform first runs one interval from now.
+            due = schedule.next_run_at or now + schedule.interval_seconds
+            self.deadlines.push(name, due)
+            planned.append(f"{name} at {time.strftime('%H:%M', time.localtime(due))}")
+        self.deadlines.push(RETENTION_TASK, now + ARCHIVE_INTERVAL_HOURS * 3600)
 
-        t = threading.Thread(target=run_scheduler, daemon=True)
+        t = threading.Thread(target=self._run_deadlines, daemon=True, name="scheduler")
         t.start()
-        print(f"Scheduler started. Scraping every {SCRAPING_INTERVAL_HOURS} hour(s).\n")
+        print(f"Scheduler started. Next scrapes: {', '.join(planned)}\n")
+
+    def _run_deadlines(self):
+        """Run tasks from the deadline queue as they fall due, until stopped."""
+        while self.running:
+            tasks = self.deadlines.wait_for_due(lambda: self.running)
+            platforms = [task for task in tasks if task != RETENTION_TASK]
+
+            if RETENTION_TASK in tasks:
+                self.run_retention()
+                self.deadlines.push(RETENTION_TASK, time.time() + ARCHIVE_INTERVAL_HOURS * 3600)
+
+            if platforms:
+                # Runs now, joins the run in flight, or follows it.
+                self.trigger_scrape(platforms)
 
     def stop(self):
         """Stop the scheduler."""
         self.running = False
-        schedule.clear()
+        self.deadlines.wake()
         print("Scheduler stopped.")
@@ -1,17 +1,118 @@
 """Base scraper interface for job platforms."""
+import hashlib
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urlsplit
 
 import requests
 
-from config import MAX_RETRIES, RATE_LIMIT_DELAY_SECONDS
+from config import (
+    BACKOFF_MAX_SECONDS,
+    EARLY_STOP_PAGINATION,
+    HTTP_CACHE_ENABLED,
+    MAX_CONCURRENT_REQUESTS_PER_HOST,
+    MAX_RETRIES,
+    PAGINATION_BATCH_SIZE,
+)
+from backend.database import (
+    generate_job_hash,
+    get_http_cache_entry,
+    get_scrape_watermark,
+    save_http_cache_entry,
+    save_scrape_watermark,
+)
+from backend.query_planner import SearchQuery
+from backend.seen_hashes import seen_hashes
+from backend.scrapers.card_selectors import compile_selectors
+from backend.scrapers.parse_pool import parse_pool
+from backend.scrapers.rate_limiter import CircuitBreaker, backoff_delay, parse_retry_after, rate_limiter
+from backend.scrapers.url_canonicalizer import canonicalize_job_url
+
+# Statuses worth retrying; anything else in the 4xx range fails immediately.
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Shared by every scraper instance so concurrent searches against the same
+# host never exceed MAX_CONCURRENT_REQUESTS_PER_HOST in-flight requests.
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(url):
+    """Return the in-flight request semaphore for the host of a URL."""
+    host = urlsplit(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS_PER_HOST)
+        return _host_semaphores[host]
+
+
+class _PendingPage:
+    """A result page submitted to the parse pool."""
+
+    def __init__(self, scraper, url, response, content_hash):
+        self.scraper = scraper
+        self.url = url
+        self.content = response.content
+        self.cache_entry = (url, response.headers.get("ETag"), response.headers.get("Last-Modified"), content_hash)
+        self.future = parse_pool.submit(scraper, response.content)
+        self.jobs = None
+
+    def result(self):
+        """Wait for the parsed jobs, merging a worker's selector counts into the scraper."""
+        if self.jobs is None:
+            try:
+                self.jobs, counts = self.future.result()
+                if counts:
+                    self.scraper.merge_selector_counts(counts)
+            except BrokenProcessPool as e:
+                parse_pool.disable(e)
+                self.jobs = self.scraper.parse_page(self.content)
+            self.content = None
+        return self.jobs
+
+
+class SearchResult:
+    """
+    Jobs returned by BaseScraper.search, plus the crawl state they imply.
+
+    The HTTP cache entries of the parsed pages and the searches' new
+    watermarks make the next run skip those pages, so they must only be
+    saved with save_state() once the jobs are stored; if storing fails, the
+    next run parses the pages again.
+    """
+
+    def __init__(self, platform_name):
+        self.platform_name = platform_name
+        self.jobs = []
+        self.cache_entries = []
+        self.watermarks = {}
+
+    def add_page(self, page):
+        self.jobs.extend(page.result())
+        if HTTP_CACHE_ENABLED:
+            self.cache_entries.append(page.cache_entry)
+
+    def save_state(self):
+        for url, etag, last_modified, content_hash in self.cache_entries:
+            save_http_cache_entry(url, etag, last_modified, content_hash)
+        for query_key, job_hash in self.watermarks.items():
+            save_scrape_watermark(self.platform_name, query_key, job_hash)
 
 
 class BaseScraper(ABC):
     """Base class for all job scrapers."""
 
+    # Declarative {field: [(tag_name, attrs), ...]} card selectors, compiled
+    # once per scraper instance into fallback chains scoped to each page.
+    SELECTORS = {}
+
     def __init__(self, platform_name):
         self.platform_name = platform_name
+        self.selectors = compile_selectors(self.SELECTORS)
+        self.circuit_breaker = CircuitBreaker()
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": (
@@ -22,21 +123,159 @@ class BaseScraper(ABC):
             "Accept-Language": "en-US,en;q=0.5",
         })
 
-    @abstractmethod
-    def fetch_jobs(self, keywords=None, location=None, max_pages=1):
+    def fetch_jobs(self, keywords="developer", location="", max_pages=1):
         """
         Fetch jobs from the platform.
 
+        Result pages are requested concurrently and handed to the parse pool
+        as they arrive. Pages that are unchanged since the last run (a 304
+        response or an identical body) are skipped without parsing.
+
+        With EARLY_STOP_PAGINATION, pages are fetched PAGINATION_BATCH_SIZE
+        at a time and paging stops after a page that is unchanged, empty,
+        holds only jobs already stored, or reaches the search's watermark
+        (the newest job of the previous run; results are newest first, so
+        everything after it is older).
+
         Args:
             keywords: Search keywords
             location: Location filter
             max_pages: Maximum pages to scrape
 
         Returns:
-            List of job dictionaries in normalized format
+            List of job dictionaries in normalized format. Crawl state is
+            not saved; use search() and SearchResult.save_state() to store it
+            after the jobs.
+        """
+        return self.search([(keywords, location)], max_pages).jobs
+
+    def search(self, queries, max_pages=1):
+        """
+        Run several (keywords, location) searches; see fetch_jobs.
+
+        Pages are parsed in worker processes while the remaining pages and
+        queries download, and jobs are returned in query and page order.
+        Remaining queries are skipped once the platform's circuit opens.
+
+        Returns a SearchResult; call its save_state() after storing its jobs.
         """
+        result = SearchResult(self.platform_name)
+        pending = []
+        for keywords, location in queries:
+            if self.circuit_breaker.is_open:
+                break
+            pending.extend(self._fetch_search(keywords, location, max_pages, result.watermarks))
+
+        for page in pending:
+            result.add_page(page)
+        return result
+
+    def _fetch_search(self, keywords, location, max_pages, watermarks):
+        """
+        Fetch one search's pages and submit them for parsing. Returns their _PendingPages.
+
+        A new watermark for the search is put in watermarks by query key.
+        """
+        query_key = SearchQuery(keywords, location).key
+        watermark = None
+        batch_size = max_pages
+        early_stop = EARLY_STOP_PAGINATION and max_pages > 1
+        if early_stop:
+            watermark = get_scrape_watermark(self.platform_name, query_key)
+            batch_size = max(1, PAGINATION_BATCH_SIZE)
+
+        pending = []
+        newest = None
+        for start in range(0, max_pages, batch_size):
+            pages = range(start, min(start + batch_size, max_pages))
+            urls = {self.build_search_url(keywords, location, page): page for page in pages}
+
+            # Pages go to the parse pool as their responses arrive; True marks
+            # a page that is unchanged since the last run.
+            submitted = {}
+            for url, response in self.fetch_pages(list(urls)):
+                if response:
+                    submitted[urls[url]] = self._submit_page(url, response) or True
+
+            stop = False
+            for page in pages:
+                pending_page = submitted.get(page)
+                if pending_page is None:
+                    continue
+                if pending_page is True:
+                    stop = True
+                    continue
+                pending.append(pending_page)
+
+                # Deciding whether to page on needs this page's jobs, in page order.
+                if early_stop:
+                    page_jobs = pending_page.result()
+                    hashes = [generate_job_hash(j["job_url"], j["job_title"], j["company_name"]) for j in page_jobs]
+                    if page == 0 and hashes:
+                        newest = hashes[0]
+                    if watermark in hashes or self._all_seen(hashes):
+                        stop = True
+            if stop:
+                break
+
+        if early_stop and newest and newest != watermark:
+            watermarks[query_key] = newest
+        return pending
+
+    @staticmethod
+    def _all_seen(hashes):
+        seen_hashes.load()
+        return all(job_hash in seen_hashes for job_hash in hashes)
+
+    def _submit_page(self, url, response):
+        """Queue a fetched result page for parsing. Returns a _PendingPage, or None if it is unchanged."""
+        if response.status_code == 304:
+            return None
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        cached = response.cache_entry
+        if cached and cached["content_hash"] == content_hash:
+            return None
+
+        return _PendingPage(self, url, response, content_hash)
+
+    @abstractmethod
+    def build_search_url(self, keywords, location, page):
+        """Return the search results URL for a zero-based page number."""
         pass
 
+    @abstractmethod
+    def parse_page(self, content):
+        """Parse a result page body into a list of normalized job dictionaries."""
+        pass
+
+    def scope_selectors(self, soup):
+        """Scope every selector chain to a freshly parsed page; call before reading its cards."""
+        for chain in self.selectors.values():
+            chain.scope(soup)
+
+    def selector_stats(self):
+        """
+        Per-field selector hit counts, useful when a platform changes its markup.
+
+        Pages parsed in the parse pool are counted once their results are
+        collected; see ParsePool.
+        """
+        return {field: chain.stats() for field, chain in self.selectors.items()}
+
+    def take_selector_counts(self):
+        """Per-field (hits, misses) since the last call, resetting them; see merge_selector_counts."""
+        return {field: chain.take_counts() for field, chain in self.selectors.items()}
+
+    def merge_selector_counts(self, counts):
+        """Add counts from take_selector_counts() on a worker's instance of this scraper."""
+        for field, (hits, misses) in counts.items():
+            self.selectors[field].add_counts(hits, misses)
+
+    def canonicalize_url(self, url):
+        """Reduce a job URL to its stable job identifier, dropping tracking parameters."""
+        return canonicalize_job_url(self.platform_name, url)
+
     def normalize_job(self, raw_job):
         """Normalize job data to standard format."""
         return {
@@ -46,21 +285,79 @@ class BaseScraper(ABC):
             "experience_level": raw_job.get("experience_level", ""),
             "job_type": raw_job.get("job_type", ""),
             "posted_date": raw_job.get("posted_date", ""),
-            "job_url": raw_job.get("job_url", ""),
+            "job_url": self.canonicalize_url(raw_job.get("job_url", "")),
             "source_platform": self.platform_name,
         }
 
-    def make_request(self, url, retries=MAX_RETRIES):
-        """Make HTTP request with retries and rate limiting."""
+    def fetch_pages(self, urls):
+        """
+        Fetch several URLs concurrently.
+
+        Yields (url, response) pairs in completion order; response is None when
+        the request failed. At most MAX_CONCURRENT_REQUESTS_PER_HOST requests
+        per host are in flight at once.
+        """
+        if len(urls) <= 1:
+            for url in urls:
+                yield url, self._limited_request(url)
+            return
+
+        workers = min(len(urls), MAX_CONCURRENT_REQUESTS_PER_HOST)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{self.platform_name}-fetch") as pool:
+            futures = {pool.submit(self._limited_request, url): url for url in urls}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _limited_request(self, url):
+        """
+        Make a conditional request while holding the per-host concurrency slot.
+
+        The cached entry for the URL is attached to the response as
+        response.cache_entry (None when the URL has not been seen before).
+        """
+        cached = get_http_cache_entry(url) if HTTP_CACHE_ENABLED else None
+        headers = {}
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        with _host_semaphore(url):
+            response = self.make_request(url, headers=headers)
+        if response is not None:
+            response.cache_entry = cached
+        return response
+
+    def make_request(self, url, retries=MAX_RETRIES, headers=None):
+        """
+        Make HTTP request with per-host rate limiting and retries.
+
+        Failed attempts back off exponentially with jitter, honouring any
+        Retry-After header. Requests are refused while the platform's circuit
+        breaker is open.
+        """
         for attempt in range(retries):
+            if not self.circuit_breaker.allow_request():
+                print(f"  {self.platform_name} circuit open, skipping {url}")
+                return None
+
+            rate_limiter.acquire(url)
             try:
-                time.sleep(RATE_LIMIT_DELAY_SECONDS)
-                response = self.session.get(url, timeout=15)
+                response = self.session.get(url, headers=headers, timeout=15)
                 response.raise_for_status()
+                self.circuit_breaker.record_success()
                 return response
             except requests.RequestException as e:
-                if attempt == retries - 1:
-                    print(f"  Error fetching {url} after {retries} attempts: {e}")
+                status = e.response.status_code if e.response is not None else None
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After")) if e.response is not None else None
+                if retry_after is not None:
+                    rate_limiter.pause(url, retry_after)
+
+                retryable = status is None or status in RETRYABLE_STATUS_CODES
+                gave_up = retry_after is not None and retry_after > BACKOFF_MAX_SECONDS
+                if attempt == retries - 1 or not retryable or gave_up:
+                    print(f"  Error fetching {url} after {attempt + 1} attempt(s): {e}")
+                    self.circuit_breaker.record_failure()
                     return None
-                time.sleep(2**attempt)
+                time.sleep(backoff_delay(attempt, retry_after))
         return None
@@ -0,0 +1,87 @@
+"""Declarative card selectors with page-scoped fallback chains."""
+from collections import Counter
+
+
+class SelectorChain:
+    """
+    Ordered fallback selectors for one field.
+
+    Each selector is a (tag_name, attrs) pair passed to BeautifulSoup's
+    find/find_all, tried in priority order. After scope(page), the first
+    time a card falls through to a fallback, that fallback is looked up once
+    on the whole page; if it matches nothing there it is skipped for the
+    remaining cards, so a layout that only matches the third fallback does
+    not pay for failed lookups on every card, and pages where the primary
+    selector always hits pay for no page lookups at all. A selector absent
+    from the page cannot match any card on it, so every card gets the same
+    result as trying the full chain, whatever cards came before it.
+    """
+
+    def __init__(self, field, selectors):
+        self.field = field
+        self.selectors = [(name, dict(attrs)) for name, attrs in selectors]
+        self.page = None
+        self.on_page = {}
+        self.hits = Counter()
+        self.misses = 0
+
+    def scope(self, page):
+        """Start a new page; whether each fallback occurs on it is checked when first needed."""
+        self.page = page
+        self.on_page = {}
+
+    def _candidates(self, node):
+        """Yield (index, name, attrs) in priority order, skipping fallbacks absent from the page."""
+        for index, (name, attrs) in enumerate(self.selectors):
+            if index and self.page is not None and node is not self.page:
+                present = self.on_page.get(index)
+                if present is None:
+                    present = self.on_page[index] = self.page.find(name, attrs) is not None
+                if not present:
+                    continue
+            yield index, name, attrs
+
+    def find(self, node):
+        """Return the first element matched by the chain, or None."""
+        for index, name, attrs in self._candidates(node):
+            elem = node.find(name, attrs)
+            if elem:
+                self.hits[index] += 1
+                return elem
+        self.misses += 1
+        return None
+
+    def find_all(self, node):
+        """Return all elements for the first selector with any match."""
+        for index, name, attrs in self._candidates(node):
+            elems = node.find_all(name, attrs)
+            if elems:
+                self.hits[index] += 1
+                return elems
+        self.misses += 1
+        return []
+
+    def take_counts(self):
+        """Return (hits, misses) counted since the last call, and reset them."""
+        counts = (dict(self.hits), self.misses)
+        self.hits.clear()
+        self.misses = 0
+        return counts
+
+    def add_counts(self, hits, misses):
+        """Fold in counts taken from another chain over the same selectors."""
+        self.hits.update(hits)
+        self.misses += misses
+
+    def stats(self):
+        """Hit counts per selector plus misses for this field."""
+        counts = {}
+        for index, (name, attrs) in enumerate(self.selectors):
+            label = name + "".join(f"[{k}]" if v is True else f"[{k}={v!r}]" for k, v in attrs.items())
+            counts[label] = self.hits[index]
+        return {"hits": counts, "misses": self.misses}
+
+
+def compile_selectors(spec):
+    """Compile a {field: [(tag_name, attrs), ...]} spec into selector chains."""
+    return {field: SelectorChain(field, selectors) for field, selectors in spec.items()}
@@ -0,0 +1,48 @@
+"""HTML parser engine selection and card-only parsing for scrapers."""
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+from config import HTML_PARSE_CARDS_ONLY, HTML_PARSER
+
+SUPPORTED_PARSERS = ("html.parser", "lxml", "html5lib")
+
+_resolved_parser = None
+
+
+def resolve_parser():
+    """Return the configured parser engine, falling back to html.parser if it is not installed."""
+    global _resolved_parser
+    if _resolved_parser is None:
+        parser = HTML_PARSER if HTML_PARSER in SUPPORTED_PARSERS else "html.parser"
+        try:
+            BeautifulSoup("", parser)
+        except FeatureNotFound:
+            print(f"  HTML parser '{parser}' is not installed, using html.parser")
+            parser = "html.parser"
+        _resolved_parser = parser
+    return _resolved_parser
+
+
+def card_strainer(*classes, attrs=()):
+    """
+    Build a SoupStrainer that keeps only job card subtrees.
+
+    A tag is kept when it carries any of the given CSS classes or any of the
+    given attribute names. Everything outside the kept subtrees is dropped
+    while parsing, so card lookups behave exactly as on the full page.
+    """
+    wanted_classes = set(classes)
+
+    def match(name, attributes):
+        attributes = attributes or {}
+        css = attributes.get("class") or ""
+        if isinstance(css, str):
+            css = css.split()
+        return bool(wanted_classes.intersection(css)) or any(a in attributes for a in attrs)
+
+    return SoupStrainer(match)
+
+
+def make_soup(content, strainer=None):
+    """Parse a page with the configured engine, restricted to the strainer when enabled."""
+    parse_only = strainer if HTML_PARSE_CARDS_ONLY else None
+    return BeautifulSoup(content, resolve_parser(), parse_only=parse_only)
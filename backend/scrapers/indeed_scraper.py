@@ -1,70 +1,94 @@
 """Indeed job scraper."""
+import re
 from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
-
 from backend.scrapers.base_scraper import BaseScraper
+from backend.scrapers.html_parsing import card_strainer, make_soup
+
+# Only the job card subtrees are parsed; see html_parsing.make_soup.
+CARD_STRAINER = card_strainer("job_seen_beacon", "jobsearch-ResultsList", attrs=("data-jk",))
+
+SELECTORS = {
+    "cards": [
+        ("div", {"class": "job_seen_beacon"}),
+        ("div", {"class": "jobsearch-ResultsList"}),
+        ("div", {"data-jk": True}),
+    ],
+    "sub_cards": [
+        ("div", {"class": "job_seen_beacon"}),
+        ("div", {"data-jk": True}),
+    ],
+    "title": [
+        ("h2", {"class": "jobTitle"}),
+        ("span", {"id": re.compile("jobTitle")}),
+        ("a", {"data-jk": True}),
+    ],
+    "company": [
+        ("span", {"class": "companyName"}),
+        ("span", {"data-testid": "company-name"}),
+    ],
+    "location": [
+        ("div", {"class": "companyLocation"}),
+        ("div", {"data-testid": "text-location"}),
+    ],
+    "date": [
+        ("span", {"class": "date"}),
+        ("span", {"data-testid": "myJobsStateDate"}),
+    ],
+}
 
 
 class IndeedScraper(BaseScraper):
     """Scraper for Indeed job postings."""
 
+    SELECTORS = SELECTORS
+
     def __init__(self):
         super().__init__("Indeed")
 
-    def fetch_jobs(self, keywords="developer", location="", max_pages=1):
-        """Fetch jobs from Indeed."""
+    def build_search_url(self, keywords, location, page):
+        """Build an Indeed job search URL."""
+        params = {
+            "q": keywords,
+            "l": location,
+            "start": page * 10,
+        }
+        return f"https://www.indeed.com/jobs?{urlencode(params)}"
+
+    def parse_page(self, content):
+        """Parse an Indeed search results page."""
         jobs = []
 
-        for page in range(max_pages):
-            params = {
-                "q": keywords,
-                "l": location,
-                "start": page * 10,
-            }
-            url = f"https://www.indeed.com/jobs?{urlencode(params)}"
-
-            response = self.make_request(url)
-            if not response:
+        soup = make_soup(content, CARD_STRAINER)
+        self.scope_selectors(soup)
+        job_cards = self.selectors["cards"].find_all(soup)
+
+        for card in job_cards:
+            if card.name == "div" and "jobsearch-ResultsList" in (card.get("class") or []):
+                sub_cards = self.selectors["sub_cards"].find_all(card)
+                for sub in sub_cards:
+                    try:
+                        job = self._parse_job_card(sub)
+                        if job and job.get("job_url"):
+                            jobs.append(self.normalize_job(job))
+                    except Exception as e:
+                        print(f"  Error parsing Indeed card: {e}")
                 continue
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            job_cards = (
-                soup.find_all("div", class_="job_seen_beacon")
-                or soup.find_all("div", class_="jobsearch-ResultsList")
-                or soup.find_all("div", {"data-jk": True})
-            )
-
-            for card in job_cards:
-                if card.name == "div" and "jobsearch-ResultsList" in (card.get("class") or []):
-                    sub_cards = card.find_all("div", class_="job_seen_beacon") or card.find_all("div", {"data-jk": True})
-                    for sub in sub_cards:
-                        try:
-                            job = self._parse_job_card(sub)
-                            if job and job.get("job_url"):
-                                jobs.append(self.normalize_job(job))
-                        except Exception as e:
-                            print(f"  Error parsing Indeed card: {e}")
-                    continue
-
-                try:
-                    job = self._parse_job_card(card)
-                    if job and job.get("job_url"):
-                        jobs.append(self.normalize_job(job))
-                except Exception as e:
-                    print(f"  Error parsing Indeed card: {e}")
-                    continue
+            try:
+                job = self._parse_job_card(card)
+                if job and job.get("job_url"):
+                    jobs.append(self.normalize_job(job))
+            except Exception as e:
+                print(f"  Error parsing Indeed card: {e}")
+                continue
 
         return jobs
 
     def _parse_job_card(self, card):
         """Parse a single Indeed job card."""
         try:
-            title_elem = (
-                card.find("h2", class_="jobTitle")
-                or card.find("span", id=lambda x: x and "jobTitle" in str(x))
-                or card.find("a", {"data-jk": True})
-            )
+            title_elem = self.selectors["title"].find(card)
 
             if not title_elem:
                 return None
@@ -79,19 +103,13 @@ class IndeedScraper(BaseScraper):
 
             job_title = link_elem.get_text(strip=True) if link_elem else ""
 
-            company_elem = (
-                card.find("span", class_="companyName")
-                or card.find("span", {"data-testid": "company-name"})
-            )
+            company_elem = self.selectors["company"].find(card)
             company_name = company_elem.get_text(strip=True) if company_elem else "Unknown"
 
-            location_elem = (
-                card.find("div", class_="companyLocation")
-                or card.find("div", {"data-testid": "text-location"})
-            )
+            location_elem = self.selectors["location"].find(card)
             location = location_elem.get_text(strip=True) if location_elem else ""
 
-            date_elem = card.find("span", class_="date") or card.find("span", {"data-testid": "myJobsStateDate"})
+            date_elem = self.selectors["date"].find(card)
             posted_date = date_elem.get_text(strip=True) if date_elem else ""
 
             return {
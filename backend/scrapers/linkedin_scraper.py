@@ -1,60 +1,81 @@
 """LinkedIn job scraper."""
 from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
-
 from backend.scrapers.base_scraper import BaseScraper
+from backend.scrapers.html_parsing import card_strainer, make_soup
+
+# Only the job card subtrees are parsed; see html_parsing.make_soup.
+CARD_STRAINER = card_strainer("base-card", "result-card", "job-search-card")
+
+SELECTORS = {
+    "cards": [
+        ("div", {"class": "base-card"}),
+        ("li", {"class": "result-card"}),
+        ("div", {"class": "job-search-card"}),
+    ],
+    "title": [
+        ("h3", {"class": "base-search-card__title"}),
+        ("h3", {"class": "result-card__title"}),
+        ("h3", {"class": "job-search-card__title"}),
+        ("h3", {}),
+    ],
+    "company": [
+        ("h4", {"class": "base-search-card__subtitle"}),
+        ("h4", {"class": "result-card__subtitle"}),
+        ("a", {"class": "hidden-nested-link"}),
+    ],
+    "location": [
+        ("span", {"class": "job-search-card__location"}),
+        ("span", {"class": "result-card__location"}),
+    ],
+    "date": [
+        ("time", {"class": "job-search-card__listdate"}),
+        ("time", {"class": "result-card__listdate"}),
+        ("time", {}),
+    ],
+}
 
 
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn job postings."""
 
+    SELECTORS = SELECTORS
+
     def __init__(self):
         super().__init__("LinkedIn")
 
-    def fetch_jobs(self, keywords="developer", location="", max_pages=1):
-        """Fetch jobs from LinkedIn public job search."""
+    def build_search_url(self, keywords, location, page):
+        """Build a LinkedIn public job search URL."""
+        params = {
+            "keywords": keywords,
+            "location": location,
+            "start": page * 25,
+        }
+        return f"https://www.linkedin.com/jobs/search/?{urlencode(params)}"
+
+    def parse_page(self, content):
+        """Parse a LinkedIn search results page."""
         jobs = []
 
-        for page in range(max_pages):
-            params = {
-                "keywords": keywords,
-                "location": location,
-                "start": page * 25,
-            }
-            url = f"https://www.linkedin.com/jobs/search/?{urlencode(params)}"
-
-            response = self.make_request(url)
-            if not response:
+        soup = make_soup(content, CARD_STRAINER)
+        self.scope_selectors(soup)
+        job_cards = self.selectors["cards"].find_all(soup)
+
+        for card in job_cards:
+            try:
+                job = self._parse_job_card(card)
+                if job and job.get("job_url"):
+                    jobs.append(self.normalize_job(job))
+            except Exception as e:
+                print(f"  Error parsing LinkedIn card: {e}")
                 continue
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            job_cards = (
-                soup.find_all("div", class_="base-card")
-                or soup.find_all("li", class_="result-card")
-                or soup.find_all("div", class_="job-search-card")
-            )
-
-            for card in job_cards:
-                try:
-                    job = self._parse_job_card(card)
-                    if job and job.get("job_url"):
-                        jobs.append(self.normalize_job(job))
-                except Exception as e:
-                    print(f"  Error parsing LinkedIn card: {e}")
-                    continue
-
         return jobs
 
     def _parse_job_card(self, card):
         """Parse a single LinkedIn job card."""
         try:
-            title_elem = (
-                card.find("h3", class_="base-search-card__title")
-                or card.find("h3", class_="result-card__title")
-                or card.find("h3", class_="job-search-card__title")
-                or card.find("h3")
-            )
+            title_elem = self.selectors["title"].find(card)
             if not title_elem:
                 return None
 
@@ -66,25 +87,13 @@ class LinkedInScraper(BaseScraper):
 
             job_title = (link_elem or title_elem).get_text(strip=True) if link_elem or title_elem else ""
 
-            company_elem = (
-                card.find("h4", class_="base-search-card__subtitle")
-                or card.find("h4", class_="result-card__subtitle")
-                or card.find("a", class_="hidden-nested-link")
-            )
+            company_elem = self.selectors["company"].find(card)
             company_name = company_elem.get_text(strip=True) if company_elem else "Unknown"
 
-            location_elem = (
-                card.find("span", class_="job-search-card__location")
-                or card.find("span", class_="result-card__location")
-                or card.find("span", class_="job-search-card__location")
-            )
+            location_elem = self.selectors["location"].find(card)
             location = location_elem.get_text(strip=True) if location_elem else ""
 
-            date_elem = (
-                card.find("time", class_="job-search-card__listdate")
-                or card.find("time", class_="result-card__listdate")
-                or card.find("time")
-            )
+            date_elem = self.selectors["date"].find(card)
             posted_date = date_elem.get("datetime", "") if date_elem and date_elem.get("datetime") else ""
 
             return {
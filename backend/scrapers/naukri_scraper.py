@@ -1,61 +1,87 @@
 """Naukri.com job scraper."""
 from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
-
 from backend.scrapers.base_scraper import BaseScraper
+from backend.scrapers.html_parsing import card_strainer, make_soup
+
+# Only the job card subtrees are parsed; see html_parsing.make_soup.
+CARD_STRAINER = card_strainer("jobTuple", "tuple", "jobCard")
+
+SELECTORS = {
+    "cards": [
+        ("article", {"class": "jobTuple"}),
+        ("div", {"class": "jobTuple"}),
+        ("div", {"class": "tuple"}),
+        ("div", {"class": "jobCard"}),
+    ],
+    "title": [
+        ("a", {"class": "title"}),
+        ("a", {"class": "jobTupleHeader"}),
+        ("a", {"data-ga-track": True}),
+        ("a", {"href": True}),
+    ],
+    "company": [
+        ("a", {"class": "subTitle"}),
+        ("div", {"class": "companyInfo"}),
+        ("span", {"class": "comp-name"}),
+    ],
+    "location": [
+        ("span", {"class": "locWdth"}),
+        ("li", {"class": "location"}),
+        ("span", {"class": "location"}),
+    ],
+    "experience": [
+        ("span", {"class": "expwdth"}),
+        ("li", {"class": "experience"}),
+        ("span", {"class": "exp"}),
+    ],
+    "date": [
+        ("span", {"class": "date"}),
+        ("span", {"class": "posted"}),
+    ],
+}
 
 
 class NaukriScraper(BaseScraper):
     """Scraper for Naukri.com job postings."""
 
+    SELECTORS = SELECTORS
+
     def __init__(self):
         super().__init__("Naukri")
 
-    def fetch_jobs(self, keywords="developer", location="", max_pages=1):
-        """Fetch jobs from Naukri.com."""
+    def build_search_url(self, keywords, location, page):
+        """Build a Naukri.com job search URL."""
+        params = {
+            "k": keywords,
+            "l": location,
+            "start": page * 20,
+        }
+        return f"https://www.naukri.com/jobs-in-india?{urlencode(params)}"
+
+    def parse_page(self, content):
+        """Parse a Naukri.com search results page."""
         jobs = []
 
-        for page in range(max_pages):
-            params = {
-                "k": keywords,
-                "l": location,
-                "start": page * 20,
-            }
-            url = f"https://www.naukri.com/jobs-in-india?{urlencode(params)}"
-
-            response = self.make_request(url)
-            if not response:
+        soup = make_soup(content, CARD_STRAINER)
+        self.scope_selectors(soup)
+        job_cards = self.selectors["cards"].find_all(soup)
+
+        for card in job_cards:
+            try:
+                job = self._parse_job_card(card)
+                if job and job.get("job_url"):
+                    jobs.append(self.normalize_job(job))
+            except Exception as e:
+                print(f"  Error parsing Naukri card: {e}")
                 continue
 
-            soup = BeautifulSoup(response.content, "html.parser")
-            job_cards = (
-                soup.find_all("article", class_="jobTuple")
-                or soup.find_all("div", class_="jobTuple")
-                or soup.find_all("div", class_="tuple")
-                or soup.find_all("div", class_="jobCard")
-            )
-
-            for card in job_cards:
-                try:
-                    job = self._parse_job_card(card)
-                    if job and job.get("job_url"):
-                        jobs.append(self.normalize_job(job))
-                except Exception as e:
-                    print(f"  Error parsing Naukri card: {e}")
-                    continue
-
         return jobs
 
     def _parse_job_card(self, card):
         """Parse a single Naukri job card."""
         try:
-            title_elem = (
-                card.find("a", class_="title")
-                or card.find("a", class_="jobTupleHeader")
-                or card.find("a", {"data-ga-track": True})
-                or card.find("a", href=True)
-            )
+            title_elem = self.selectors["title"].find(card)
 
             if not title_elem:
                 return None
@@ -66,28 +92,16 @@ class NaukriScraper(BaseScraper):
 
             job_title = title_elem.get_text(strip=True) if title_elem else ""
 
-            company_elem = (
-                card.find("a", class_="subTitle")
-                or card.find("div", class_="companyInfo")
-                or card.find("span", class_="comp-name")
-            )
+            company_elem = self.selectors["company"].find(card)
             company_name = company_elem.get_text(strip=True) if company_elem else "Unknown"
 
-            location_elem = (
-                card.find("span", class_="locWdth")
-                or card.find("li", class_="location")
-                or card.find("span", class_="location")
-            )
+            location_elem = self.selectors["location"].find(card)
             location = location_elem.get_text(strip=True) if location_elem else ""
 
-            exp_elem = (
-                card.find("span", class_="expwdth")
-                or card.find("li", class_="experience")
-                or card.find("span", class_="exp")
-            )
+            exp_elem = self.selectors["experience"].find(card)
             experience_level = exp_elem.get_text(strip=True) if exp_elem else ""
 
-            date_elem = card.find("span", class_="date") or card.find("span", class_="posted")
+            date_elem = self.selectors["date"].find(card)
             posted_date = date_elem.get_text(strip=True) if date_elem else ""
 
             return {
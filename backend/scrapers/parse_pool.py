@@ -0,0 +1,99 @@
+"""Process pool that parses result pages away from the network threads."""
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config import PARSE_WORKERS
+
+# One scraper instance per class in each worker process, reused across pages.
+_worker_scrapers = {}
+
+
+def _parse_in_worker(scraper_class, content):
+    """Parse a page. Returns (jobs, selector counts for this page) for the parent to merge."""
+    scraper = _worker_scrapers.get(scraper_class)
+    if scraper is None:
+        scraper = _worker_scrapers[scraper_class] = scraper_class()
+    jobs = scraper.parse_page(content)
+    return jobs, scraper.take_selector_counts()
+
+
+class ParsePool:
+    """
+    Parses result page bodies into normalized jobs on worker processes.
+
+    BeautifulSoup parsing is CPU bound, so in threads it is serialized by the
+    GIL with the network waits of every scraper; in worker processes it
+    scales with cores while the scraper threads keep fetching. Workers are
+    started with "spawn" because the parent runs many threads.
+
+    Spawned workers re-import the main module, so entry points must not
+    start the app at import time (see run.py and backend.app.get_scheduler);
+    workers only import the scraper classes they parse for.
+
+    With workers <= 1, or when worker processes cannot be started or die,
+    pages are parsed in the calling thread instead. Workers send each page's
+    selector hit counts back with its jobs, to be merged into the parent's
+    scraper so BaseScraper.selector_stats() covers every page.
+    """
+
+    def __init__(self, workers=PARSE_WORKERS):
+        self.workers = workers
+        self.executor = None
+        self.disabled = workers <= 1
+        self.lock = threading.Lock()
+
+    def _get_executor(self):
+        with self.lock:
+            if self.executor is None and not self.disabled:
+                try:
+                    self.executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except (OSError, NotImplementedError, ValueError) as e:
+                    print(f"  Parse pool unavailable ({e}); parsing in-process")
+                    self.disabled = True
+            return self.executor
+
+    def disable(self, reason):
+        """Fall back to in-process parsing for the rest of the process's life."""
+        with self.lock:
+            if not self.disabled:
+                print(f"  Parse pool failed ({reason}); parsing in-process")
+            self.disabled = True
+
+    def submit(self, scraper, content):
+        """
+        Parse content with scraper.parse_page.
+
+        Returns a Future of (jobs, selector counts); the counts are None when
+        the page was parsed in-process and already counted on scraper.
+        """
+        executor = None if self.disabled else self._get_executor()
+        if executor is not None:
+            try:
+                return executor.submit(_parse_in_worker, type(scraper), content)
+            except (BrokenProcessPool, RuntimeError) as e:
+                self.disable(e)
+        return self.parse_inline(scraper, content)
+
+    @staticmethod
+    def parse_inline(scraper, content):
+        future = Future()
+        try:
+            future.set_result((scraper.parse_page(content), None))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self):
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+
+parse_pool = ParsePool()
+atexit.register(parse_pool.shutdown)
@@ -0,0 +1,145 @@
+"""Shared per-host rate limiting, retry backoff and circuit breaking for scrapers."""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from config import (
+    BACKOFF_BASE_SECONDS,
+    BACKOFF_MAX_SECONDS,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_DELAY_SECONDS,
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Starts full, so an idle host is not delayed."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Hold back every caller for the given number of seconds."""
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """Keeps one token bucket per host."""
+
+    def __init__(self, delay_seconds=RATE_LIMIT_DELAY_SECONDS, burst=RATE_LIMIT_BURST):
+        self.rate = 1.0 / delay_seconds if delay_seconds > 0 else float("inf")
+        self.burst = max(1, burst)
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def _bucket(self, url):
+        host = urlsplit(url).netloc
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate, self.burst)
+            return self.buckets[host]
+
+    def acquire(self, url):
+        """Wait for permission to send a request to the URL's host."""
+        if self.rate == float("inf"):
+            return
+        self._bucket(url).acquire()
+
+    def pause(self, url, seconds):
+        """Stop all requests to the URL's host for a while (e.g. after a 429)."""
+        if self.rate == float("inf"):
+            return
+        self._bucket(url).pause(seconds)
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a platform after repeated failures.
+
+    After CIRCUIT_BREAKER_FAILURE_THRESHOLD consecutive failed requests the
+    circuit opens and requests are refused. Once the cooldown has passed the
+    circuit is half-open: the next request is let through, and its outcome
+    closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                 cooldown_seconds=CIRCUIT_BREAKER_COOLDOWN_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        """True while requests are being refused."""
+        with self.lock:
+            return self.opened_at is not None and time.monotonic() - self.opened_at < self.cooldown_seconds
+
+    def allow_request(self):
+        """Return True if a request may be sent now."""
+        return not self.is_open
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (seconds or HTTP date). Returns seconds or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt, retry_after=None):
+    """Full-jitter exponential backoff, never shorter than a Retry-After hint."""
+    delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+rate_limiter = RateLimiter()
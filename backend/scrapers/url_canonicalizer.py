@@ -0,0 +1,63 @@
+"""Canonical job URLs, so the same posting hashes the same on every run."""
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Per-session tracking parameters stripped from URLs without a known job id.
+TRACKING_PARAMS = {
+    "currentjobid", "fccid", "from", "pos", "position", "refid", "sid", "src",
+    "tk", "trackingid", "trk", "vjs", "xp",
+}
+
+_LINKEDIN_JOB_ID_RE = re.compile(r"/jobs/view/(?:[^/]*?-)?(\d+)/?$")
+
+
+def _strip_tracking(url):
+    """Drop the fragment and tracking parameters, keeping the other query parameters in order."""
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def canonicalize_linkedin_url(url):
+    """https://www.linkedin.com/jobs/view/<job id>/ for any LinkedIn job link."""
+    parts = urlsplit(url)
+    match = _LINKEDIN_JOB_ID_RE.search(parts.path)
+    job_id = match.group(1) if match else dict(parse_qsl(parts.query)).get("currentJobId")
+    if not job_id or not job_id.isdigit():
+        return _strip_tracking(url)
+    return f"https://www.linkedin.com/jobs/view/{job_id}/"
+
+
+def canonicalize_indeed_url(url):
+    """https://<indeed host>/viewjob?jk=<job key>; /rc/clk redirects carry the same jk."""
+    parts = urlsplit(url)
+    params = dict(parse_qsl(parts.query))
+    job_key = params.get("jk") or params.get("vjk")
+    if not job_key:
+        return _strip_tracking(url)
+    return urlunsplit((parts.scheme or "https", parts.netloc, "/viewjob", urlencode({"jk": job_key}), ""))
+
+
+def canonicalize_naukri_url(url):
+    """Naukri job ids are in the path; the query string only carries tracking."""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+
+_CANONICALIZERS = {
+    "linkedin": canonicalize_linkedin_url,
+    "indeed": canonicalize_indeed_url,
+    "naukri": canonicalize_naukri_url,
+}
+
+
+def canonicalize_job_url(platform_name, url):
+    """Return the canonical form of a job URL for a platform."""
+    if not url:
+        return url
+    canonicalize = _CANONICALIZERS.get((platform_name or "").lower(), _strip_tracking)
+    return canonicalize(url)
@@ -0,0 +1,80 @@
+"""Process-wide set of known job hashes, checked before ingest touches SQLite."""
+import sys
+import threading
+
+from backend.database import generate_job_hash, get_known_job_hashes
+
+
+class SeenHashSet:
+    """
+    Membership set of the job_hash values already stored.
+
+    Each md5 job hash is kept as its first 64 bits in a Python int set, which
+    costs about a third of the memory of the hex strings. Two different
+    hashes sharing a 64-bit prefix is the only way a new job is wrongly
+    reported as seen; the chance of that for any lookup is
+    false_positive_rate(). A miss always means the job still has to be
+    checked against the database, so other writers are never missed.
+    """
+
+    def __init__(self):
+        self.keys = set()
+        self.loaded = False
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(job_hash):
+        return int(job_hash[:16], 16)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, job_hash):
+        return self._key(job_hash) in self.keys
+
+    def add(self, job_hash):
+        self.keys.add(self._key(job_hash))
+
+    def load(self):
+        """Warm the set from the jobs and job_duplicates tables (once)."""
+        with self.lock:
+            if self.loaded:
+                return
+            for job_hash in get_known_job_hashes():
+                self.add(job_hash)
+            self.loaded = True
+
+    def filter_unseen(self, jobs):
+        """Return (position, job, job_hash) for the jobs whose hash is not known yet."""
+        self.load()
+        unseen = []
+        for position, job in enumerate(jobs):
+            job_hash = generate_job_hash(job["job_url"], job["job_title"], job["company_name"])
+            if job_hash in self:
+                self.hits += 1
+            else:
+                self.misses += 1
+                unseen.append((position, job, job_hash))
+        return unseen
+
+    def memory_bytes(self):
+        """Approximate memory held by the set and its int keys."""
+        return sys.getsizeof(self.keys) + len(self.keys) * sys.getsizeof(2**63)
+
+    def false_positive_rate(self):
+        """Chance that a new hash collides with a stored 64-bit prefix."""
+        return len(self.keys) / 2**64
+
+    def stats(self):
+        return {
+            "entries": len(self.keys),
+            "memory_bytes": self.memory_bytes(),
+            "false_positive_rate": self.false_positive_rate(),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+seen_hashes = SeenHashSet()
@@ -0,0 +1,154 @@
+"""Deadline queue and adaptive per-source scrape intervals for the scheduler."""
+import heapq
+import itertools
+import threading
+import time
+
+from config import (
+    SCRAPE_MAX_INTERVAL_HOURS,
+    SCRAPE_MIN_INTERVAL_MINUTES,
+    SCRAPE_TARGET_NEW_JOBS,
+    SCRAPE_YIELD_SMOOTHING,
+    SCRAPING_INTERVAL_HOURS,
+)
+from backend.database import get_source_schedules, save_source_schedule
+
+
+class DeadlineQueue:
+    """
+    Min-heap of (due_time, task) with one pending deadline per task.
+
+    Rescheduling a task pushes a new entry; the superseded one is skipped
+    when it reaches the top. wait_for_due() sleeps until the earliest
+    deadline, or until push() or wake() signals a change.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.due = {}
+        self.counter = itertools.count()
+        self.changed = threading.Condition()
+
+    def push(self, task, due_time):
+        with self.changed:
+            self.due[task] = due_time
+            heapq.heappush(self.heap, (due_time, next(self.counter), task))
+            self.changed.notify_all()
+
+    def next_due(self):
+        """Earliest pending deadline, or None when nothing is scheduled."""
+        with self.changed:
+            self._drop_stale()
+            return self.heap[0][0] if self.heap else None
+
+    def _drop_stale(self):
+        while self.heap and self.due.get(self.heap[0][2]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+
+    def pop_due(self, now):
+        """Remove and return the tasks whose deadline has passed, earliest first."""
+        tasks = []
+        with self.changed:
+            self._drop_stale()
+            while self.heap and self.heap[0][0] <= now:
+                _, _, task = heapq.heappop(self.heap)
+                del self.due[task]
+                tasks.append(task)
+                self._drop_stale()
+        return tasks
+
+    def wait_for_due(self, should_run):
+        """
+        Block until a task is due or should_run() turns false.
+
+        Returns the due tasks (empty when stopped).
+        """
+        with self.changed:
+            while should_run():
+                self._drop_stale()
+                now = time.time()
+                if self.heap and self.heap[0][0] <= now:
+                    break
+                timeout = self.heap[0][0] - now if self.heap else None
+                self.changed.wait(timeout)
+            else:
+                return []
+        return self.pop_due(time.time())
+
+    def wake(self):
+        with self.changed:
+            self.changed.notify_all()
+
+
+class SourceSchedule:
+    """
+    Adaptive scrape interval for one source, persisted in source_schedule.
+
+    yield_rate is a smoothed count of new jobs per hour. The next interval
+    aims for about SCRAPE_TARGET_NEW_JOBS new jobs per scrape, so busy
+    sources are scraped more often and quiet ones less, within
+    SCRAPE_MIN_INTERVAL_MINUTES and SCRAPE_MAX_INTERVAL_HOURS.
+    """
+
+    def __init__(self, name, interval_seconds=None, yield_rate=None, last_run_at=None, next_run_at=None):
+        self.name = name
+        self.interval_seconds = interval_seconds or SCRAPING_INTERVAL_HOURS * 3600
+        self.yield_rate = yield_rate
+        self.last_run_at = last_run_at
+        self.next_run_at = next_run_at
+
+    @staticmethod
+    def _clamp(seconds):
+        return max(SCRAPE_MIN_INTERVAL_MINUTES * 60, min(seconds, SCRAPE_MAX_INTERVAL_HOURS * 3600))
+
+    def record(self, new_jobs, now=None):
+        """
+        Fold one scrape's new-job count into the yield rate and plan the next run.
+
+        new_jobs is None when the scrape did not complete (skipped or failed);
+        the rate is left alone and the current interval reused.
+        Returns the next run time.
+        """
+        now = now or time.time()
+        if new_jobs is not None:
+            elapsed_hours = (now - self.last_run_at) / 3600 if self.last_run_at else self.interval_seconds / 3600
+            sample = new_jobs / max(elapsed_hours, SCRAPE_MIN_INTERVAL_MINUTES / 60)
+            if self.yield_rate is None:
+                # Start from the rate the current interval was chosen for.
+                self.yield_rate = SCRAPE_TARGET_NEW_JOBS / (self.interval_seconds / 3600)
+            self.yield_rate += SCRAPE_YIELD_SMOOTHING * (sample - self.yield_rate)
+            if self.yield_rate > 0:
+                self.interval_seconds = self._clamp(SCRAPE_TARGET_NEW_JOBS / self.yield_rate * 3600)
+            else:
+                self.interval_seconds = SCRAPE_MAX_INTERVAL_HOURS * 3600
+            self.last_run_at = now
+
+        self.next_run_at = now + self.interval_seconds
+        self.save()
+        return self.next_run_at
+
+    def save(self):
+        save_source_schedule(self.name, self.interval_seconds, self.yield_rate, self.last_run_at, self.next_run_at)
+
+    def to_dict(self):
+        return {
+            "interval_seconds": round(self.interval_seconds, 1),
+            "yield_rate_per_hour": None if self.yield_rate is None else round(self.yield_rate, 3),
+            "last_run_at": self.last_run_at,
+            "next_run_at": self.next_run_at,
+        }
+
+
+def load_source_schedules(names):
+    """Return {name: SourceSchedule}, restoring persisted state where there is any."""
+    stored = {row["platform_name"]: row for row in get_source_schedules()}
+    schedules = {}
+    for name in names:
+        row = stored.get(name)
+        if row:
+            schedules[name] = SourceSchedule(
+                name, row["interval_seconds"], row["yield_rate"], row["last_run_at"], row["next_run_at"],
+            )
+        else:
+            schedules[name] = SourceSchedule(name)
+    return schedules
@@ -11,6 +11,15 @@ PROJECT_ROOT = Path(__file__).parent
 
 # Database Configuration
 DATABASE_PATH = PROJECT_ROOT / "jobs.db"
+DB_POOL_SIZE = 8  # Idle connections kept for reuse
+DB_BUSY_TIMEOUT_SECONDS = 10
+DB_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+DB_CACHE_SIZE_KB = 20000
+JOB_HOT_RETENTION_DAYS = 30  # Jobs older than this move to the jobs_archive table
+EMAIL_LOG_RETENTION_DAYS = 90  # Notification log and finished outbox rows older than this are deleted
+ARCHIVE_BATCH_SIZE = 500  # Jobs moved per archival transaction
+ARCHIVE_INTERVAL_HOURS = 24  # How often the scheduler runs archival
+VACUUM_PAGES_PER_STEP = 1000  # Free pages returned to the OS per incremental vacuum step
 
 # Email Configuration (SMTP)
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -19,11 +28,38 @@ SMTP_USERNAME = os.getenv("SMTP_USERNAME", "")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
 EMAIL_FROM = os.getenv("EMAIL_FROM", "")
 EMAIL_TO = os.getenv("EMAIL_TO", "")
+EMAIL_MAX_ATTEMPTS = 5  # Delivery attempts before an outbox email is marked failed
+EMAIL_RETRY_BASE_SECONDS = 60  # First retry delay; doubles per attempt
+EMAIL_SEND_LEASE_SECONDS = 300  # A claimed outbox email is sent again if not finished within this
+EMAIL_OUTBOX_POLL_SECONDS = 30
+SMTP_IDLE_TIMEOUT_SECONDS = 300  # Close the reused SMTP session after this long idle
 
 # Scraping Configuration
-SCRAPING_INTERVAL_HOURS = 1
-RATE_LIMIT_DELAY_SECONDS = 2
+SCRAPING_INTERVAL_HOURS = 1  # Starting interval; each platform then adapts to its new-job rate
+SCRAPE_MIN_INTERVAL_MINUTES = 15  # Busiest sources are scraped at most this often
+SCRAPE_MAX_INTERVAL_HOURS = 12  # Quietest sources are scraped at least this often
+SCRAPE_TARGET_NEW_JOBS = 5  # New jobs per scrape the adaptive interval aims for
+SCRAPE_YIELD_SMOOTHING = 0.3  # Weight of the latest scrape in the smoothed new-jobs-per-hour rate
+RATE_LIMIT_DELAY_SECONDS = 2  # Token refill interval per host
+RATE_LIMIT_BURST = 3  # Requests an idle host may receive back to back
 MAX_RETRIES = 3
+BACKOFF_BASE_SECONDS = 1
+BACKOFF_MAX_SECONDS = 60
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # Failed requests before a platform is skipped
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 900
+MAX_CONCURRENT_REQUESTS_PER_HOST = 4  # Result pages in flight per host
+SCRAPER_MAX_WORKERS = 8  # Platforms scraped in parallel per cycle (1 = sequential)
+SEARCH_MAX_PAGES = 1  # Result pages fetched per planned search query
+EARLY_STOP_PAGINATION = True  # Stop paging a search once a page holds only known jobs
+PAGINATION_BATCH_SIZE = MAX_CONCURRENT_REQUESTS_PER_HOST  # Result pages fetched concurrently while paging with early stop
+SCRAPE_RUN_HISTORY = 20  # Recent scrape runs kept for /api/scrape/<run_id>
+HTML_PARSER = os.getenv("HTML_PARSER", "html.parser")  # html.parser, lxml or html5lib
+HTTP_CACHE_ENABLED = True  # Conditional requests; unchanged result pages are not re-parsed
+HTML_PARSE_CARDS_ONLY = True  # Parse only job card subtrees instead of the whole page
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", str(os.cpu_count() or 1)))  # Page parsing processes (1 = parse in-process)
+NEAR_DUPLICATE_DETECTION = True  # Link cross-platform reposts to one canonical job
+NEAR_DUPLICATE_MAX_HAMMING = 3  # SimHash bit difference still considered the same job (max 3)
+NEAR_DUPLICATE_TITLE_SIMILARITY = 0.8  # Minimum title word overlap (Jaccard) for a near-duplicate
 
 # Job Alert Keywords (comma-separated)
 ALERT_KEYWORDS = [k.strip() for k in os.getenv("ALERT_KEYWORDS", "python,developer,software engineer").split(",") if k.strip()]
@@ -31,7 +67,14 @@ ALERT_KEYWORDS = [k.strip() for k in os.getenv("ALERT_KEYWORDS", "python,develop
 # Job Alert Locations (comma-separated)
 ALERT_LOCATIONS = [l.strip() for l in os.getenv("ALERT_LOCATIONS", "remote,hybrid").split(",") if l.strip()]
 
+# Match alert keywords/locations only as whole words ("java" will not match "javascript")
+ALERT_MATCH_WHOLE_WORDS = os.getenv("ALERT_MATCH_WHOLE_WORDS", "false").lower() in ("1", "true", "yes")
+
 # Flask Configuration
 FLASK_HOST = "0.0.0.0"
 FLASK_PORT = 5000
 FLASK_DEBUG = True
+API_MAX_PAGE_SIZE = 500  # Largest page /api/jobs returns when paginating
+API_CACHE_MAX_ENTRIES = 256  # Serialized read-API responses kept in memory
+STREAM_KEEPALIVE_SECONDS = 15  # Idle interval between /api/jobs/stream keepalives
+DATA_CHANGE_POLL_SECONDS = 2  # How often waiting streams check for jobs written by other processes
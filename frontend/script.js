@@ -1,5 +1,17 @@
 const API_BASE = '/api';
+const PAGE_SIZE = 100;
+const CARD_FIELDS = [
+  'id', 'job_title', 'company_name', 'location', 'experience_level',
+  'job_type', 'posted_date', 'job_url', 'source_platform', 'is_new',
+].join(',');
 let allJobs = [];
+let nextCursor = null;
+// Filters the loaded pages were requested with; "Load more" continues them.
+let activeFilters = {};
+// Bumped on every first-page load so responses to older filters are dropped.
+let loadSeq = 0;
+// Every location seen this session, so picking one does not shrink the list.
+const knownLocations = new Set();
 let savedJobs = JSON.parse(localStorage.getItem('savedJobs') || '[]');
 
 // Theme
@@ -17,16 +29,41 @@ themeToggle.addEventListener('click', () => {
   localStorage.setItem('theme', next);
 });
 
-document.addEventListener('DOMContentLoaded', () => {
-  loadJobs();
-  loadStats();
+document.addEventListener('DOMContentLoaded', async () => {
   setupListeners();
-  setInterval(() => {
-    loadJobs();
-    loadStats();
-  }, 5 * 60 * 1000);
+  loadStats();
+  await loadJobs();
+  if (window.EventSource) {
+    subscribeToNewJobs();
+  } else {
+    setInterval(() => {
+      loadJobs();
+      loadStats();
+    }, 5 * 60 * 1000);
+  }
 });
 
+// Appends jobs pushed by the server as they are scraped. EventSource
+// reconnects on its own and resumes after the last job id it received.
+function subscribeToNewJobs() {
+  const lastId = allJobs.reduce((max, job) => Math.max(max, job.id || 0), 0);
+  const source = new EventSource(`${API_BASE}/jobs/stream?last_id=${lastId}`);
+  let statsTimer = null;
+
+  source.addEventListener('job', (e) => {
+    const job = JSON.parse(e.data);
+    clearTimeout(statsTimer);
+    statsTimer = setTimeout(loadStats, 500);
+    addLocations([job]);
+    updateLocationOptions();
+    // Filtering happens on the server, so pushed jobs are only shown
+    // unfiltered; filtered views pick them up on the next reload.
+    if (Object.keys(activeFilters).length || allJobs.some((j) => j.id === job.id)) return;
+    allJobs.unshift(job);
+    displayJobs(allJobs);
+  });
+}
+
 function setupListeners() {
   document.getElementById('searchBtn').addEventListener('click', applyFilters);
   document.getElementById('searchInput').addEventListener('keypress', (e) => {
@@ -42,21 +79,69 @@ function setupListeners() {
     loadStats();
   });
   document.getElementById('scrapeBtn').addEventListener('click', triggerScrape);
+  document.getElementById('loadMoreBtn').addEventListener('click', loadMoreJobs);
+}
+
+// Filter values as /api/jobs query parameters, leaving out empty ones.
+function currentFilters() {
+  const filters = {
+    search: document.getElementById('searchInput').value.trim(),
+    location: document.getElementById('locationFilter').value,
+    experience: document.getElementById('experienceFilter').value,
+    job_type: document.getElementById('jobTypeFilter').value,
+    source: document.getElementById('sourceFilter').value,
+  };
+  return Object.fromEntries(Object.entries(filters).filter(([, value]) => value));
 }
 
+async function fetchJobsPage(filters, cursor) {
+  const params = new URLSearchParams({ ...filters, limit: PAGE_SIZE, fields: CARD_FIELDS });
+  if (cursor) params.set('cursor', cursor);
+  const res = await fetch(`${API_BASE}/jobs?${params}`);
+  return res.json();
+}
+
+// Loads the first page of jobs matching the current filters.
 async function loadJobs() {
+  const seq = ++loadSeq;
+  const filters = currentFilters();
   showLoading(true);
   try {
-    const res = await fetch(`${API_BASE}/jobs`);
-    const data = await res.json();
+    const data = await fetchJobsPage(filters, null);
+    if (seq !== loadSeq) return;
+    activeFilters = filters;
     allJobs = data.jobs || [];
-    applyFilters();
+    nextCursor = data.next_cursor || null;
+    addLocations(allJobs);
     updateLocationOptions();
+    displayJobs(allJobs);
   } catch (err) {
+    if (seq !== loadSeq) return;
     console.error('Error loading jobs:', err);
     showError('Failed to load jobs. Please try again.');
   } finally {
-    showLoading(false);
+    if (seq === loadSeq) showLoading(false);
+  }
+}
+
+async function loadMoreJobs() {
+  if (!nextCursor) return;
+  const seq = loadSeq;
+  const btn = document.getElementById('loadMoreBtn');
+  btn.disabled = true;
+  try {
+    const data = await fetchJobsPage(activeFilters, nextCursor);
+    if (seq !== loadSeq) return;
+    allJobs = allJobs.concat(data.jobs || []);
+    nextCursor = data.next_cursor || null;
+    addLocations(data.jobs || []);
+    updateLocationOptions();
+    displayJobs(allJobs);
+  } catch (err) {
+    console.error('Error loading more jobs:', err);
+    showError('Failed to load more jobs. Please try again.');
+  } finally {
+    btn.disabled = false;
   }
 }
 
@@ -71,10 +156,16 @@ async function loadStats() {
   }
 }
 
+function addLocations(jobs) {
+  jobs.forEach((job) => {
+    if (job.location) knownLocations.add(job.location);
+  });
+}
+
 function updateLocationOptions() {
   const sel = document.getElementById('locationFilter');
   const val = sel.value;
-  const locations = [...new Set(allJobs.map((j) => j.location).filter(Boolean))].sort();
+  const locations = [...knownLocations].sort();
   sel.innerHTML = '<option value="">All Locations</option>';
   locations.forEach((loc) => {
     const opt = document.createElement('option');
@@ -85,31 +176,15 @@ function updateLocationOptions() {
   sel.value = val;
 }
 
+// Filters run on the server, so a change reloads from the first page.
 function applyFilters() {
-  const search = document.getElementById('searchInput').value.toLowerCase().trim();
-  const location = document.getElementById('locationFilter').value.toLowerCase();
-  const experience = document.getElementById('experienceFilter').value.toLowerCase();
-  const jobType = document.getElementById('jobTypeFilter').value.toLowerCase();
-  const source = document.getElementById('sourceFilter').value;
-
-  const filtered = allJobs.filter((job) => {
-    if (search) {
-      const text = `${(job.job_title || '')} ${(job.company_name || '')}`.toLowerCase();
-      if (!text.includes(search)) return false;
-    }
-    if (location && !((job.location || '').toLowerCase().includes(location))) return false;
-    if (experience && !((job.experience_level || '').toLowerCase().includes(experience))) return false;
-    if (jobType && !((job.job_type || '').toLowerCase().includes(jobType))) return false;
-    if (source && job.source_platform !== source) return false;
-    return true;
-  });
-
-  displayJobs(filtered);
+  loadJobs();
 }
 
 function displayJobs(jobs) {
   const container = document.getElementById('jobsContainer');
   const noJobs = document.getElementById('noJobs');
+  document.getElementById('loadMoreBtn').style.display = nextCursor ? 'block' : 'none';
 
   if (jobs.length === 0) {
     container.innerHTML = '';
@@ -173,7 +248,7 @@ function toggleSaveJob(jobId) {
     savedJobs.push(jobId);
   }
   localStorage.setItem('savedJobs', JSON.stringify(savedJobs));
-  applyFilters();
+  displayJobs(allJobs);
 }
 
 function clearFilters() {
@@ -182,7 +257,6 @@ function clearFilters() {
   document.getElementById('experienceFilter').value = '';
   document.getElementById('jobTypeFilter').value = '';
   document.getElementById('sourceFilter').value = '';
-  updateLocationOptions();
   applyFilters();
 }
 
@@ -193,13 +267,23 @@ async function triggerScrape() {
 
   try {
     const res = await fetch(`${API_BASE}/scrape`, { method: 'POST' });
-    const data = await res.json();
+    let run = await res.json();
     if (!res.ok) {
-      alert(`Scraping failed: ${data.error || res.statusText || 'Unknown error'}`);
+      alert(`Scraping failed: ${run.error || res.statusText || 'Unknown error'}`);
       return;
     }
-    alert(`Scraping completed. ${data.new_jobs_count || 0} new jobs found.`);
-    loadJobs();
+    while (run.status === 'queued' || run.status === 'running') {
+      btn.textContent = `Scraping... (${run.progress.completed}/${run.progress.total})`;
+      await new Promise((resolve) => setTimeout(resolve, 2000));
+      const poll = await fetch(`${API_BASE}/scrape/${run.run_id}`);
+      if (!poll.ok) break;
+      run = await poll.json();
+    }
+    if (run.status === 'failed') {
+      alert(`Scraping failed: ${run.error || 'Unknown error'}`);
+      return;
+    }
+    alert(`Scraping completed. ${run.new_jobs_count || 0} new jobs found.`);
     loadStats();
   } catch (err) {
     console.error('Error triggering scrape:', err);
@@ -0,0 +1,126 @@
+"""Maintenance commands for Job Notification Tracker.
+
+Usage:
+    python manage.py rebuild-stats
+    python manage.py canonicalize-urls
+    python manage.py archive-jobs [--days N] [--vacuum]
+    python manage.py add-subscription EMAIL [--keywords K,...] [--locations L,...]
+                                            [--platforms P,...] [--experience E,...]
+    python manage.py list-subscriptions
+    python manage.py remove-subscription ID
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import EMAIL_LOG_RETENTION_DAYS, JOB_HOT_RETENTION_DAYS
+from backend.database import (
+    add_subscription,
+    archive_old_jobs,
+    canonicalize_job_urls,
+    delete_subscription,
+    get_subscriptions,
+    incremental_vacuum,
+    init_database,
+    prune_email_history,
+    rebuild_job_stats,
+    vacuum_database,
+)
+from backend.scrapers.url_canonicalizer import canonicalize_job_url
+
+
+def _split(value):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def rebuild_stats(args):
+    """Recompute the /api/stats counters from the jobs table."""
+    rebuild_job_stats()
+    print("Job stats rebuilt.")
+
+
+def canonicalize_urls(args):
+    """Strip tracking parameters from stored job URLs and merge the duplicates this exposes."""
+    updated, merged = canonicalize_job_urls(canonicalize_job_url)
+    print(f"{updated} job(s) rewritten, {merged} duplicate(s) merged.")
+
+
+def archive_jobs(args):
+    """Move jobs older than the hot window to jobs_archive and prune old email history."""
+    archived = archive_old_jobs(args.days)
+    pruned = prune_email_history(EMAIL_LOG_RETENTION_DAYS)
+    print(f"{len(archived)} job(s) archived, {pruned} email history row(s) pruned.")
+    if args.vacuum:
+        vacuum_database()
+        print("Database vacuumed; incremental vacuum is enabled.")
+    else:
+        print(f"{incremental_vacuum()} free page(s) released.")
+
+
+def add_subscription_command(args):
+    """Subscribe an email address to job alerts."""
+    subscription_id = add_subscription(
+        args.email,
+        keywords=_split(args.keywords),
+        locations=_split(args.locations),
+        platforms=_split(args.platforms),
+        experience_levels=_split(args.experience),
+    )
+    print(f"Subscription {subscription_id} added for {args.email}.")
+
+
+def list_subscriptions(args):
+    """List active alert subscriptions."""
+    for sub in get_subscriptions():
+        rules = ", ".join(
+            f"{field}={','.join(sub[field])}"
+            for field in ("keywords", "locations", "platforms", "experience_levels")
+            if sub[field]
+        )
+        print(f"{sub['id']}\t{sub['email']}\t{rules or '(all jobs)'}")
+
+
+def remove_subscription(args):
+    """Remove an alert subscription."""
+    if delete_subscription(args.id):
+        print(f"Subscription {args.id} removed.")
+    else:
+        print(f"No subscription with id {args.id}.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Job Notification Tracker maintenance commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("rebuild-stats", help=rebuild_stats.__doc__).set_defaults(func=rebuild_stats)
+
+    subparsers.add_parser("canonicalize-urls", help=canonicalize_urls.__doc__).set_defaults(func=canonicalize_urls)
+
+    archive = subparsers.add_parser("archive-jobs", help=archive_jobs.__doc__)
+    archive.add_argument("--days", type=int, default=JOB_HOT_RETENTION_DAYS, help="Hot window in days")
+    archive.add_argument("--vacuum", action="store_true", help="Run a full VACUUM and enable incremental vacuum")
+    archive.set_defaults(func=archive_jobs)
+
+    add = subparsers.add_parser("add-subscription", help=add_subscription_command.__doc__)
+    add.add_argument("email")
+    add.add_argument("--keywords", help="Comma-separated title keywords")
+    add.add_argument("--locations", help="Comma-separated locations")
+    add.add_argument("--platforms", help="Comma-separated platforms (LinkedIn, Indeed, Naukri)")
+    add.add_argument("--experience", help="Comma-separated experience levels")
+    add.set_defaults(func=add_subscription_command)
+
+    subparsers.add_parser("list-subscriptions", help=list_subscriptions.__doc__).set_defaults(func=list_subscriptions)
+
+    remove = subparsers.add_parser("remove-subscription", help=remove_subscription.__doc__)
+    remove.add_argument("id", type=int)
+    remove.set_defaults(func=remove_subscription)
+
+    args = parser.parse_args(argv)
+    init_database()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
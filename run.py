@@ -4,7 +4,8 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from backend.app import main
-
 if __name__ == "__main__":
+    # Imported here: parse pool workers re-import this module and need no app.
+    from backend.app import main
+
     main()
@@ -0,0 +1,21 @@
+import pytest
+
+from backend import database
+from backend.scrapers.parse_pool import parse_pool
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """A fresh database in a temporary directory, with an empty connection pool."""
+    monkeypatch.setattr(database, "DATABASE_PATH", tmp_path / "jobs.db")
+    monkeypatch.setattr(database, "_connection_pool", database.queue.LifoQueue(maxsize=database.DB_POOL_SIZE))
+    monkeypatch.setattr(database, "_fts_available", None)
+    monkeypatch.setattr(database, "_generation_poll", {"conn": None, "data_version": None, "generation": None, "checked_at": None})
+    database.init_database()
+    yield database
+
+
+@pytest.fixture(autouse=True)
+def parse_inline(monkeypatch):
+    """Parse pages in-process so tests never start worker processes."""
+    monkeypatch.setattr(parse_pool, "disabled", True)
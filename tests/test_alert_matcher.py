@@ -0,0 +1,20 @@
+from backend.alert_matcher import AlertMatcher
+
+
+def test_rule_matched_through_case_folding_is_reported():
+    matcher = AlertMatcher(["developer"], ["istanbul", "izmir"])
+    jobs = [
+        {"job_title": "Python Developer", "location": "İstanbul Dev"},
+        {"job_title": "Developer", "location": "İzmir"},
+    ]
+    assert [rules for _, rules in matcher.filter(jobs)] == [
+        {"keywords": ["developer"], "locations": ["istanbul"]},
+        {"keywords": ["developer"], "locations": ["izmir"]},
+    ]
+
+
+def test_phrase_wins_over_shorter_rule():
+    matcher = AlertMatcher(["python", "Python  Developer"], [])
+    assert matcher.match({"job_title": "Senior python\tdeveloper"}) == {
+        "keywords": ["Python  Developer"], "locations": [],
+    }
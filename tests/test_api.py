@@ -0,0 +1,20 @@
+import pytest
+
+from backend.app import app
+
+
+@pytest.fixture
+def client(db):
+    return app.test_client()
+
+
+@pytest.mark.parametrize("limit", ["abc", "0", "-5", ""])
+def test_invalid_limit_is_rejected(client, limit):
+    response = client.get(f"/api/jobs?limit={limit}")
+    assert response.status_code == 400
+
+
+def test_valid_limit_paginates(client):
+    response = client.get("/api/jobs?limit=10")
+    assert response.status_code == 200
+    assert "next_cursor" in response.get_json()
@@ -0,0 +1,58 @@
+from backend.scrapers.url_canonicalizer import canonicalize_job_url
+
+URL = "https://www.linkedin.com/jobs/view/python-developer-123"
+CANONICAL = "https://www.linkedin.com/jobs/view/123/"
+
+
+def insert(conn, table, job_id, url, is_new):
+    conn.execute(
+        f"INSERT INTO {table} (id, job_title, company_name, job_url, source_platform, job_hash, is_new) "
+        "VALUES (?, 'Dev', 'Foo', ?, 'LinkedIn', ?, ?)",
+        (job_id, url, f"hash-{table}-{job_id}", is_new),
+    )
+
+
+def seed(db):
+    conn = db.get_db_connection()
+    insert(conn, "jobs", 1, f"{URL}?refId=a", 0)
+    insert(conn, "jobs", 2, f"{URL}?refId=b&trackingId=c", 1)
+    insert(conn, "jobs_archive", 3, f"{URL}?trk=d", 0)
+    conn.executemany(
+        "INSERT INTO email_notifications_log (job_id, email_sent_to, email_subject) VALUES (?, 'a@example.com', 'Jobs')",
+        [(2,), (3,)],
+    )
+    conn.execute(
+        "INSERT INTO job_duplicates (canonical_job_id, job_title, company_name, job_url, source_platform, job_hash) "
+        "VALUES (2, 'Dev', 'Foo', 'https://in.indeed.com/viewjob?jk=abc', 'Indeed', 'dup-hash')"
+    )
+    conn.commit()
+    db.release_db_connection(conn)
+
+
+def rows(db, query):
+    conn = db.get_db_connection()
+    result = [tuple(row) for row in conn.execute(query)]
+    db.release_db_connection(conn)
+    return result
+
+
+def test_copies_merge_into_the_oldest_job(db):
+    seed(db)
+    assert db.canonicalize_job_urls(canonicalize_job_url) == (1, 2)
+
+    assert rows(db, "SELECT id, job_url, is_new FROM jobs") == [(1, CANONICAL, 1)]
+    assert rows(db, "SELECT id FROM jobs_archive") == []
+    assert rows(db, "SELECT job_id FROM email_notifications_log") == [(1,), (1,)]
+    assert rows(db, "SELECT canonical_job_id FROM job_duplicates") == [(1,)]
+
+
+def test_init_database_migrates_once(db):
+    seed(db)
+    conn = db.get_db_connection()
+    conn.execute("PRAGMA user_version = 0")
+    conn.commit()
+    db.release_db_connection(conn)
+
+    db.init_database()
+    assert rows(db, "SELECT id, job_url FROM jobs") == [(1, CANONICAL)]
+    assert rows(db, "PRAGMA user_version") == [(1,)]
@@ -0,0 +1,43 @@
+"""Selector chains must give each card the same result whatever cards came before it."""
+from backend.scrapers.naukri_scraper import NaukriScraper
+
+PAGE = b"""
+<html><body>
+<article class="jobTuple">
+  <a class="title" href="/job-listings-python-developer-111">Python Developer</a>
+  <div class="companyInfo">Foo Corp</div>
+</article>
+<article class="jobTuple">
+  <a class="title" href="/job-listings-java-developer-222">Java Developer</a>
+  <div class="companyInfo"><a class="subTitle">Bar Ltd</a><span>4.1</span><span>(120 Reviews)</span></div>
+</article>
+</body></html>
+"""
+
+
+def test_fallback_match_does_not_shadow_higher_priority_selector():
+    jobs = NaukriScraper().parse_page(PAGE)
+
+    assert [job["company_name"] for job in jobs] == ["Foo Corp", "Bar Ltd"]
+
+
+def test_card_order_does_not_change_results():
+    scraper = NaukriScraper()
+    first = scraper.parse_page(PAGE)
+    second = scraper.parse_page(PAGE)
+
+    assert first == second
+
+
+def test_worker_selector_counts_merge_into_parent():
+    from backend.scrapers.parse_pool import _parse_in_worker
+
+    parent = NaukriScraper()
+    jobs, counts = _parse_in_worker(NaukriScraper, PAGE)
+    parent.merge_selector_counts(counts)
+
+    assert len(jobs) == 2
+    assert sum(parent.selector_stats()["company"]["hits"].values()) == 2
+    # Counts are per page: the worker's totals were reset when taken.
+    _, counts = _parse_in_worker(NaukriScraper, PAGE)
+    assert sum(counts["company"][0].values()) == 2
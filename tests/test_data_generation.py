@@ -0,0 +1,43 @@
+import sqlite3
+import threading
+
+
+def write_from_another_process(db):
+    other = sqlite3.connect(str(db.DATABASE_PATH))
+    other.execute(
+        "INSERT INTO jobs (job_title, company_name, job_url, source_platform, job_hash) "
+        "VALUES ('Dev', 'Foo', 'https://example.com/1', 'Naukri', 'abc')"
+    )
+    other.commit()
+    other.close()
+
+
+def test_generation_changes_on_writes_from_other_connections(db, monkeypatch):
+    monkeypatch.setattr(db, "DATA_CHANGE_POLL_SECONDS", 0)
+    before = db.get_data_generation()
+    write_from_another_process(db)
+    assert db.get_data_generation() != before
+
+
+def test_generation_is_polled_at_most_once_per_interval(db, monkeypatch):
+    monkeypatch.setattr(db, "DATA_CHANGE_POLL_SECONDS", 3600)
+    before = db.get_data_generation()
+    write_from_another_process(db)
+    assert db.get_data_generation() == before
+
+    db.notify_data_change()
+    assert db.get_data_generation() != before
+
+
+def test_unrelated_writes_keep_the_generation(db, monkeypatch):
+    monkeypatch.setattr(db, "DATA_CHANGE_POLL_SECONDS", 0)
+    before = db.get_data_generation()
+    db.save_http_cache_entry("https://example.com/search", None, None, "hash")
+    assert db.get_data_generation() == before
+
+
+def test_wait_notices_external_change(db, monkeypatch):
+    monkeypatch.setattr(db, "DATA_CHANGE_POLL_SECONDS", 0.05)
+    generation = db.get_data_generation()
+    threading.Timer(0.1, write_from_another_process, args=(db,)).start()
+    assert db.wait_for_data_change(generation, timeout=5) != generation
@@ -0,0 +1,53 @@
+from backend.dedupe import Fingerprint
+
+
+def job(platform, title="Python Developer", location="Pune"):
+    return {"job_title": title, "company_name": "Foo Corp", "location": location, "source_platform": platform}
+
+
+def test_same_posting_on_another_platform_is_a_near_duplicate():
+    assert Fingerprint.from_job(job("Naukri")).is_near_duplicate(Fingerprint.from_job(job("Indeed")))
+
+
+def test_similar_postings_on_one_platform_are_kept_apart():
+    assert not Fingerprint.from_job(job("Naukri")).is_near_duplicate(Fingerprint.from_job(job("Naukri")))
+
+
+def test_missing_location_does_not_match():
+    assert not Fingerprint.from_job(job("Naukri", location="")).is_near_duplicate(Fingerprint.from_job(job("Indeed")))
+
+
+def test_old_fingerprint_table_is_rebuilt_with_platform(db):
+    conn = db.get_db_connection()
+    conn.execute("DROP TABLE job_fingerprints")
+    conn.execute(
+        "CREATE TABLE job_fingerprints (job_id INTEGER PRIMARY KEY, simhash INTEGER NOT NULL, "
+        "company_key TEXT NOT NULL, title_key TEXT NOT NULL, location_key TEXT NOT NULL)"
+    )
+    conn.commit()
+    db.release_db_connection(conn)
+
+    db.init_database()
+    conn = db.get_db_connection()
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(job_fingerprints)")}
+    db.release_db_connection(conn)
+    assert "source_platform" in columns
+
+
+def test_backfill_pages_through_every_job(db):
+    from backend.dedupe import NearDuplicateIndex
+
+    conn = db.get_db_connection()
+    conn.executemany(
+        "INSERT INTO jobs (job_title, company_name, location, job_url, source_platform, job_hash) "
+        "VALUES (?, 'Foo', 'Pune', ?, 'Naukri', ?)",
+        [(f"Dev {i}", f"https://example.com/{i}", f"hash-{i}") for i in range(2100)],
+    )
+    conn.commit()
+    db.release_db_connection(conn)
+
+    assert [job["id"] for job in db.get_jobs_without_fingerprints(after_id=2000, limit=5)] == [2001, 2002, 2003, 2004, 2005]
+    index = NearDuplicateIndex()
+    index.load()
+    assert len(index) == 2100
+    assert db.get_jobs_without_fingerprints() == []
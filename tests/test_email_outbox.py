@@ -0,0 +1,19 @@
+def test_email_is_claimed_by_one_sender_until_its_lease_expires(db):
+    email_id = db.enqueue_email("a@example.com", "Jobs", "body", [])
+
+    assert db.claim_email(email_id, now=100, lease_until=400)
+    assert not db.claim_email(email_id, now=101, lease_until=401)
+    assert db.get_due_emails(200) == []
+
+    # The first sender died; once the lease lapses another may claim it.
+    assert [email["id"] for email in db.get_due_emails(400)] == [email_id]
+    assert db.claim_email(email_id, now=400, lease_until=700)
+
+
+def test_failed_send_returns_email_to_pending(db):
+    email_id = db.enqueue_email("a@example.com", "Jobs", "body", [])
+    db.claim_email(email_id, now=100, lease_until=400)
+    db.mark_email_failed(email_id, "timeout", next_attempt_at=160)
+
+    [email] = db.get_due_emails(160)
+    assert email["status"] == "pending" and email["attempts"] == 1
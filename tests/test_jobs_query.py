@@ -0,0 +1,64 @@
+import pytest
+
+
+@pytest.mark.parametrize("kwargs", [{"fields": ["nope"]}, {"cursor": "not-a-cursor"}])
+def test_invalid_page_request_does_not_leak_connection(db, kwargs):
+    conn = db.get_db_connection()
+    db.release_db_connection(conn)
+
+    with pytest.raises(ValueError):
+        db.get_jobs_page(**kwargs)
+    assert db.get_db_connection() is conn
+
+
+def test_invalid_fields_do_not_leak_connection(db):
+    conn = db.get_db_connection()
+    db.release_db_connection(conn)
+
+    with pytest.raises(ValueError):
+        db.get_all_jobs(fields=["nope"])
+    assert db.get_db_connection() is conn
+
+
+def _add_jobs(db, titles):
+    return db.insert_jobs([
+        {"job_title": title, "company_name": "Acme", "job_url": f"https://example.com/{i}", "source_platform": "Naukri"}
+        for i, title in enumerate(titles)
+    ])
+
+
+def test_search_pages_follow_relevance_order(db):
+    _add_jobs(db, [
+        "Python developer",
+        "Python Python Python engineer",
+        "Java developer",
+        "Senior Python backend developer with Django and Flask experience",
+        "Python Python analyst",
+    ])
+    filters = {"search": "python"}
+    expected = [job["id"] for job in db.get_all_jobs(filters)]
+
+    ids, cursor = [], None
+    while True:
+        jobs, cursor = db.get_jobs_page(filters, limit=2, cursor=cursor)
+        ids += [job["id"] for job in jobs]
+        assert all("search_rank" not in job for job in jobs)
+        if cursor is None:
+            break
+
+    assert len(ids) == 4
+    assert ids == expected
+
+
+def test_cursor_from_other_ordering_is_rejected(db):
+    _add_jobs(db, ["Python developer", "Python engineer", "Java developer"])
+    _, newest_cursor = db.get_jobs_page(limit=1)
+    _, ranked_cursor = db.get_jobs_page({"search": "python"}, limit=1)
+    conn = db.get_db_connection()
+    db.release_db_connection(conn)
+
+    with pytest.raises(ValueError):
+        db.get_jobs_page({"search": "python"}, limit=1, cursor=newest_cursor)
+    with pytest.raises(ValueError):
+        db.get_jobs_page(limit=1, cursor=ranked_cursor)
+    assert db.get_db_connection() is conn
@@ -0,0 +1,40 @@
+from backend.query_planner import SearchQuery, plan_queries
+
+
+def subscription(keywords=(), locations=(), platforms=()):
+    return {"keywords": list(keywords), "locations": list(locations), "platforms": list(platforms)}
+
+
+def test_subscription_terms_are_merged_into_the_plan():
+    queries = plan_queries(
+        ["developer"], ["pune"],
+        subscriptions=[subscription(["data engineer", "python developer"], ["remote", "Pune"])],
+    )
+    assert queries == [
+        SearchQuery("developer", "pune"), SearchQuery("data engineer", "remote"),
+        SearchQuery("data engineer", "pune"), SearchQuery("python developer", "remote"),
+    ]
+
+
+def test_pairs_are_not_crossed_between_subscribers():
+    queries = plan_queries([], [], subscriptions=[
+        subscription(["rust"], ["berlin"]),
+        subscription(["golang"], ["london"]),
+    ])
+    assert queries == [SearchQuery("rust", "berlin"), SearchQuery("golang", "london")]
+
+
+def test_rule_set_without_locations_searches_anywhere():
+    queries = plan_queries(["developer"], [], subscriptions=[subscription(["golang"], ["remote"])])
+    assert queries == [SearchQuery("developer", ""), SearchQuery("golang", "remote")]
+
+
+def test_pair_covered_by_a_broader_pair_is_dropped():
+    queries = plan_queries(["developer"], [], subscriptions=[subscription(["python developer"], ["pune"])])
+    assert queries == [SearchQuery("developer", "")]
+
+
+def test_platform_specific_subscriptions_only_plan_their_platform():
+    subscriptions = [subscription(["rust"], platforms=["naukri"])]
+    assert SearchQuery("rust", "") in plan_queries(["developer"], [], subscriptions, platform="Naukri")
+    assert SearchQuery("rust", "") not in plan_queries(["developer"], [], subscriptions, platform="Indeed")
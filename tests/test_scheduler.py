@@ -0,0 +1,30 @@
+import threading
+
+from backend.scheduler import JobScheduler
+
+
+def test_scrape_now_during_partial_run_queues_the_other_platforms(monkeypatch):
+    scheduler = JobScheduler()
+    release = threading.Event()
+    scraped = []
+    finished = threading.Semaphore(0)
+
+    def scrape_all_platforms(run, scrapers):
+        scraped.append([scraper.platform_name for scraper in scrapers])
+        release.wait(5)
+        run.status = "completed"
+        finished.release()
+
+    monkeypatch.setattr(scheduler, "scrape_all_platforms", scrape_all_platforms)
+
+    partial, started = scheduler.trigger_scrape(["LinkedIn"])
+    assert started
+    follow_up, started = scheduler.trigger_scrape()
+    assert started and follow_up is not partial
+    assert list(follow_up.platforms) == ["Indeed", "Naukri"]
+    assert scheduler.trigger_scrape(["LinkedIn"]) == (partial, False)
+    assert scheduler.trigger_scrape(["Naukri"]) == (follow_up, False)
+
+    release.set()
+    assert finished.acquire(timeout=5) and finished.acquire(timeout=5)
+    assert scraped == [["LinkedIn"], ["Indeed", "Naukri"]]
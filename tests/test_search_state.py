@@ -0,0 +1,66 @@
+"""Crawl state must only be saved once the jobs it skips next time are stored."""
+from backend.scrapers.naukri_scraper import NaukriScraper
+
+PAGE = b"""
+<html><body>
+<article class="jobTuple">
+  <a class="title" href="/job-listings-python-developer-111">Python Developer</a>
+  <div class="companyInfo"><a class="subTitle">Foo Corp</a></div>
+</article>
+</body></html>
+"""
+
+
+class FakeResponse:
+    status_code = 200
+    content = PAGE
+    headers = {"ETag": '"v1"'}
+    cache_entry = None
+
+
+class FakeScraper(NaukriScraper):
+    def fetch_pages(self, urls):
+        for url in urls:
+            yield url, FakeResponse()
+
+
+def test_cache_entries_wait_for_save_state(db):
+    scraper = FakeScraper()
+    result = scraper.search([("python", "")], max_pages=1)
+    url = scraper.build_search_url("python", "", 0)
+
+    assert [job["company_name"] for job in result.jobs] == ["Foo Corp"]
+    assert db.get_http_cache_entry(url) is None
+
+    result.save_state()
+    assert db.get_http_cache_entry(url)["etag"] == '"v1"'
+
+
+def test_watermark_waits_for_save_state(db):
+    scraper = FakeScraper()
+    result = scraper.search([("python", "")], max_pages=2)
+
+    assert db.get_scrape_watermark("Naukri", "python|") is None
+    result.save_state()
+    assert db.get_scrape_watermark("Naukri", "python|") is not None
+
+
+def test_pages_are_submitted_as_they_arrive(db, monkeypatch):
+    events = []
+
+    class StreamingScraper(NaukriScraper):
+        def fetch_pages(self, urls):
+            for url in reversed(urls):
+                events.append(("fetched", url))
+                yield url, FakeResponse()
+
+        def _submit_page(self, url, response):
+            events.append(("submitted", url))
+            return super()._submit_page(url, response)
+
+    scraper = StreamingScraper()
+    monkeypatch.setattr(scraper, "_all_seen", lambda hashes: False)
+    scraper.search([("python", "")], max_pages=2)
+
+    first, second = (scraper.build_search_url("python", "", page) for page in (0, 1))
+    assert events == [("fetched", second), ("submitted", second), ("fetched", first), ("submitted", first)]